@@ -2,12 +2,30 @@
 Configuration module for Avaamo Agentic Audio Evaluator
 """
 import os
+from functools import cached_property
 from dotenv import load_dotenv
-import streamlit as st
 
 # Load environment variables
 load_dotenv()
 
+def _secrets_api_key():
+    """OpenAI key from Streamlit secrets, or None when unavailable"""
+    # Support both flat and namespaced TOML
+    # e.g. either OPENAI_API_KEY="..." or [OPEN-AI]\nOPENAI_API_KEY="..."
+    try:
+        # streamlit is only imported when the key is first needed, not by every config import
+        import streamlit as st
+        # flat key at root
+        secrets_api_key = st.secrets.get("OPENAI_API_KEY")
+        if not secrets_api_key and "OPEN-AI" in st.secrets:
+            # namespaced under [OPEN-AI]
+            section = st.secrets["OPEN-AI"]
+            # section can be dict-like or Secrets object
+            secrets_api_key = section.get("OPENAI_API_KEY") if hasattr(section, "get") else section["OPENAI_API_KEY"]
+        return secrets_api_key
+    except Exception:
+        return None
+
 class Config:
     """Configuration class for the application"""
     
@@ -43,21 +61,7 @@ class Config:
         # Request timeout (in milliseconds)
         self.timeout = 30000
         
-        # OpenAI Configuration
-        # Prefer Streamlit secrets; support both flat and namespaced TOML
-        # e.g. either OPENAI_API_KEY="..." or [OPEN-AI]\nOPENAI_API_KEY="..."
-        secrets_api_key = None
-        try:
-            # flat key at root
-            secrets_api_key = st.secrets.get("OPENAI_API_KEY")
-            if not secrets_api_key and "OPEN-AI" in st.secrets:
-                # namespaced under [OPEN-AI]
-                section = st.secrets["OPEN-AI"]
-                # section can be dict-like or Secrets object
-                secrets_api_key = section.get("OPENAI_API_KEY") if hasattr(section, "get") else section["OPENAI_API_KEY"]
-        except Exception:
-            pass
-        self.openai_api_key = secrets_api_key or os.getenv("OPENAI_API_KEY")
+        # OpenAI Configuration (openai_api_key is resolved on first access, see below)
         self.llm_model = os.getenv('LLM_MODEL', 'gpt-4o')
 
 
@@ -79,5 +83,16 @@ class Config:
         # Temperature for LLM generation of next utterance
         self.dynamic_temperature = '0.3'
 
+    @cached_property
+    def openai_api_key(self):
+        """Prefer Streamlit secrets, then the OPENAI_API_KEY env var; resolved once per instance"""
+        return _secrets_api_key() or os.getenv("OPENAI_API_KEY")
+
+    def __getstate__(self):
+        # Resolve the key before the config is pickled to a run process, which then never
+        # needs streamlit secrets itself
+        self.openai_api_key
+        return self.__dict__
+
 # Create global config instance
 config = Config() 
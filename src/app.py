@@ -6,7 +6,7 @@ import glob
 import os
 import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
 # Disable tokenizers parallelism to avoid fork warnings
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
@@ -19,7 +19,7 @@ from src.services.conversation.session_service import SessionService
 from src.services.conversation.websocket_service import WebSocketService
 from src.services.io.download_service import DownloadService
 from src.services.conversation.audio_service import AudioService
-from src.services.evaluation.openai_service import OpenAIService
+from src.services.evaluation.openai_service import get_openai_service, close_openai_services
 from src.services.io.test_results_service import TestResultsService
 from src.services.tts.google_tts_service import GoogleTTSService
 from src.services.conversation.dynamic_run_service import DynamicRunService
@@ -28,8 +28,10 @@ from src.services.conversation.dynamic_run_service import DynamicRunService
 class AvaamoAudioEvaluator:
     """Main application class for Avaamo Audio Evaluator"""
     
-    def __init__(self, config):
+    def __init__(self, config, close_connections: bool = True):
         self.config = config
+        # False when the caller keeps the event loop alive across runs (see run_evaluator_process)
+        self.close_connections = close_connections
     
     async def run(self) -> Dict[str, Any]:
         """Main execution function - processes all conversation IDs"""
@@ -38,14 +40,19 @@ class AvaamoAudioEvaluator:
         # Validate configuration
         if not self._validate_config():
             return {'success': False, 'error': 'Configuration validation failed'}
-        
-        # Check if we have multiple conversation IDs
-        if hasattr(self.config, 'conversation_ids') and len(self.config.conversation_ids) > 1:
-            Logger.info(f"📋 Processing {len(self.config.conversation_ids)} conversations")
-            return await self._run_multiple_conversations()
-        else:
-            Logger.info("📋 Processing single conversation")
-            return await self._run_single_conversation(self.config.conversation_id)
+
+        try:
+            # Check if we have multiple conversation IDs
+            if hasattr(self.config, 'conversation_ids') and len(self.config.conversation_ids) > 1:
+                Logger.info(f"📋 Processing {len(self.config.conversation_ids)} conversations")
+                return await self._run_multiple_conversations()
+            else:
+                Logger.info("📋 Processing single conversation")
+                return await self._run_single_conversation(self.config.conversation_id)
+        finally:
+            # Release pooled OpenAI connections opened during this run
+            if self.close_connections:
+                await close_openai_services()
     
     async def _run_multiple_conversations(self) -> Dict[str, Any]:
         """Run the evaluation for multiple conversation IDs"""
@@ -116,8 +123,7 @@ class AvaamoAudioEvaluator:
             # Step 2: Prepare inputs depending on mode
             if getattr(self.config, 'synthetic_mode', False):
                 # If conversation_mode is text, bypass audio entirely
-                from config.config import config as runtime_cfg
-                if getattr(runtime_cfg, 'conversation_mode', 'voice') == 'text' and (self.config.synthetic_files is None or len(self.config.synthetic_files) == 0):
+                if getattr(self.config, 'conversation_mode', 'voice') == 'text' and (self.config.synthetic_files is None or len(self.config.synthetic_files) == 0):
                     Logger.step(2, 'Preparing synthetic text steps...')
                     provided_texts = list(self.config.synthetic_texts or [])
                     if not provided_texts:
@@ -213,7 +219,7 @@ class AvaamoAudioEvaluator:
             # Next step: Create WebSocket connection (after inputs are ready)
             next_step_index = 3 if not getattr(self.config, 'synthetic_mode', False) else 3
             Logger.step(next_step_index, 'Creating WebSocket connection...')
-            ws_result = await WebSocketService.create_connection(session_result['data'])
+            ws_result = await WebSocketService.create_connection(session_result['data'], self.config)
             
             if not ws_result['success']:
                 Logger.error('\n💥 Failed to create WebSocket connection')
@@ -249,8 +255,7 @@ class AvaamoAudioEvaluator:
                     temperature=float(getattr(self.config, 'dynamic_temperature', 0.3))
                 )
             else:
-                from config.config import config as runtime_cfg
-                if getattr(runtime_cfg, 'conversation_mode', 'voice') == 'text' and getattr(self.config, 'synthetic_mode', False) and (self.config.synthetic_files is None or len(self.config.synthetic_files) == 0):
+                if getattr(self.config, 'conversation_mode', 'voice') == 'text' and getattr(self.config, 'synthetic_mode', False) and (self.config.synthetic_files is None or len(self.config.synthetic_files) == 0):
                     Logger.step(next_step_index + 1, 'Sending text steps...')
                     provided_texts = list(self.config.synthetic_texts or [])
                     audio_results = await AudioService.send_all_text_steps_sequentially(
@@ -287,14 +292,14 @@ class AvaamoAudioEvaluator:
                 
                 if history_files:
                     latest_history_file = max(history_files, key=Path)  # Get the most recent
-                    conversation_history_content = TestResultsService.read_conversation_history(latest_history_file)
+                    conversation_history_content = await TestResultsService.read_conversation_history(latest_history_file)
                     
                     if conversation_history_content:
                         # Extract clean transcript
                         actual_transcript = TestResultsService.extract_clean_transcript(conversation_history_content)
                         
-                        # Initialize LLM service
-                        openai_service = OpenAIService({
+                        # Reuse the shared LLM service for this event loop
+                        openai_service = get_openai_service({
                             'api_key': self.config.openai_api_key,
                             'model': self.config.llm_model
                         })
@@ -368,4 +373,34 @@ class AvaamoAudioEvaluator:
                 Logger.error(f"❌ Missing required configuration: {field}")
                 return False
         
-        return True 
\ No newline at end of file
+        return True 
+
+
+# One event loop per pool worker, kept across tasks so pooled OpenAI connections (DNS/TLS)
+# opened by one run are reused by the next; asyncio.run would tear them down each time.
+# asyncio.Runner on Python 3.11+, otherwise a plain persistent loop
+_RUNNER: Optional[Any] = None
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run_in_worker_loop(coro) -> Any:
+    global _RUNNER, _LOOP
+    if hasattr(asyncio, "Runner"):
+        if _RUNNER is None:
+            _RUNNER = asyncio.Runner()
+        return _RUNNER.run(coro)
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP.run_until_complete(coro)
+
+
+def run_evaluator_process(config, pid_registry=None, run_key: str = "") -> Dict[str, Any]:
+    """Process-pool entry point: run the evaluator for config in this worker process
+
+    Records the worker pid in pid_registry (a Manager dict) under run_key so the caller can
+    terminate the run.
+    """
+    if pid_registry is not None:
+        pid_registry[run_key] = os.getpid()
+    return _run_in_worker_loop(AvaamoAudioEvaluator(config, close_connections=False).run())
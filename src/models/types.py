@@ -63,6 +63,9 @@ class Defaults:
     CONNECTION_TIMEOUT = 10000  # milliseconds
     BOT_RESPONSE_WAIT = 5000  # milliseconds (increased from 3s to 5s)
     
+    # Downloads
+    MAX_CONCURRENT_DOWNLOADS = 4  # parallel step-audio downloads
+    
 
 # Initialize paths
 PATHS = Paths()
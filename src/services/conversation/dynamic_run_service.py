@@ -7,7 +7,7 @@ from typing import Dict, List
 import json
 
 from src.models.types import PATHS
-from src.services.evaluation.openai_service import OpenAIService
+from src.services.evaluation.openai_service import get_openai_service
 from src.services.tts.google_tts_service import GoogleTTSService
 from src.utils.logger import Logger
 
@@ -25,7 +25,7 @@ class DynamicRunService:
     ) -> Dict:
         """Generate conversation steps using LLM based on scenario"""
         try:
-            llm = OpenAIService({
+            llm = get_openai_service({
                 'api_key': openai_api_key,
                 'model': llm_model,
                 'temperature': temperature
@@ -126,8 +126,7 @@ Generate exactly {max_steps} steps:
                 output_dir = PATHS.DYNAMIC_VOICES
             
             # Clear existing files
-            for file in output_dir.glob("*.wav"):
-                file.unlink()
+            GoogleTTSService.clear_outputs(output_dir)
             
             # Generate audio using Google TTS
             tts = GoogleTTSService(language="en", tld="com", min_duration=8.0, sample_rate=24000)
@@ -207,7 +206,7 @@ Generate exactly {max_steps} steps:
             Logger.info(f"🎯 Starting dynamic conversation for scenario: {scenario}")
             
             # Initialize LLM and TTS
-            llm = OpenAIService({
+            llm = get_openai_service({
                 'api_key': openai_api_key,
                 'model': llm_model,
                 'temperature': temperature
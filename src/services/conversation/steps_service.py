@@ -3,17 +3,18 @@ from pathlib import Path
 from typing import List
 
 
+_STEP_PATTERN = re.compile(r"^step\s*\d+\s*:\s*(.+)$", re.IGNORECASE)
+
+
 def parse_steps_from_text(raw_text: str) -> List[str]:
-    lines = [line.strip() for line in raw_text.splitlines()]
-    lines = [line for line in lines if line]
     steps: List[str] = []
-    step_pattern = re.compile(r"^step\s*\d+\s*:\s*(.+)$", re.IGNORECASE)
-    for line in lines:
-        match = step_pattern.match(line)
-        if match:
-            steps.append(match.group(1).strip())
-        else:
-            steps.append(line)
+    # One pass: strip, skip blanks and drop an optional "Step N:" prefix per line
+    for line in raw_text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = _STEP_PATTERN.match(line)
+        steps.append(match.group(1).strip() if match else line)
     return steps
 
 
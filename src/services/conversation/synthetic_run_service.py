@@ -4,7 +4,7 @@ from typing import Dict, List
 
 from src.models.types import PATHS
 from src.services.conversation.steps_service import read_steps_file
-from src.services.tts import GoogleTTSService, MeloTTSService, CoquiTTSService, EdgeTTSService
+from src.services.tts import BaseTTSService, GoogleTTSService, MeloTTSService, CoquiTTSService, EdgeTTSService
 
 
 class SyntheticRunService:
@@ -25,6 +25,9 @@ class SyntheticRunService:
             if not texts:
                 return {"success": False, "error": "No steps found in file"}
 
+            # Synthetic runs send every WAV in SYNTH_STEPS, so drop files from earlier runs
+            BaseTTSService.clear_outputs(PATHS.SYNTH_STEPS)
+
             engine_lower = (engine or "google").strip().lower()
             if engine_lower in ("coqui", "coqui-tts"):
                 tts = CoquiTTSService(language=language, speaker=accent, speed=speed, emotion=emotion, sample_rate=sample_rate)
@@ -15,8 +15,12 @@ class WebSocketService:
     """Service for managing WebSocket connections"""
 
     @staticmethod
-    async def create_connection(session_data: Dict) -> Dict:
-        """Create WebSocket connection for audio/text streaming"""
+    async def create_connection(session_data: Dict, run_config=None) -> Dict:
+        """Create WebSocket connection for audio/text streaming
+
+        run_config is the run's Config; the module-level default config is used when omitted.
+        """
+        cfg = run_config or config
         try:
             # The session_data should contain the API response with a 'token' field
             token = session_data.get('token')
@@ -31,7 +35,7 @@ class WebSocketService:
                     raise ValueError("Token not found in session data")
 
             # Construct WebSocket URL with token and mode
-            ws_url = f"{config.ws_url}?jst={token}&mode={config.conversation_mode}"
+            ws_url = f"{cfg.ws_url}?jst={token}&mode={cfg.conversation_mode}"
 
             Logger.info(f"🔌 Connecting to WebSocket")
 
@@ -2,57 +2,33 @@
 OpenAI Service - Handles LLM-based conversation evaluation
 """
 import json
+import re
 import asyncio
+import importlib.util
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Any, Optional
+import httpx
 from openai import AsyncOpenAI
 from src.utils.logger import Logger
 
-class OpenAIService:
-    """Service for OpenAI API integration and conversation evaluation"""
-    
-    def __init__(self, options: Dict[str, Any]):
-        api_key = options.get('api_key')
-        model = options.get('model')
-        temperature = options.get('temperature')
-        
-        if not api_key:
-            raise ValueError('OpenAI API key is required')
-        
-        self.model = model or 'gpt-4o'
-        self.temperature = float(temperature) if temperature is not None else 0.2
-        
-        self.openai = AsyncOpenAI(
-            api_key=api_key
-        )
-    
-    async def evaluate_conversation(
-        self, 
-        actual_transcript: str, 
-        golden_transcript: str, 
-        test_id: str, 
-        channel_id: str,
-        run_type: str = "human",
-        scenario: Optional[str] = None
-    ) -> Dict:
-        """Evaluate if the actual conversation followed the golden conversation path"""
-        try:
-            Logger.info('🔍 Starting LLM conversation evaluation...')
-            # Logger.info(
-            #     f"""
-            #     actual_transcript: {actual_transcript}
-            #     golden_transcript: {golden_transcript}
-            #     test_id: {test_id}
-            #     channel_id: {channel_id}
-            #     run_type: {run_type}
-            #     scenario: {scenario}
-            #     """
-            # )
-            
-            def build_prompt() -> str:
-                rt = (run_type or "human").lower()
-                if rt == "human":
-                    return f"""
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
+_JSON_BLOCK_RE = re.compile(r'\{[\s\S]*\}')
+
+# Keys every evaluation response is expected to contain
+_REQUIRED_EVALUATION_KEYS = ('test_id', 'channelId', 'scenario', 'scenario_result', 'transcript', 'cover_story')
+
+# Template text the LLM may echo instead of copying the actual transcript (empty values are
+# replaced as well)
+_TRANSCRIPT_PLACEHOLDERS = ("Copy actual transcript here", "Copy the actual conversation transcript here")
+
+# Evaluation prompt templates keyed by run type (filled via str.format_map)
+_HUMAN_TMPL = """
 GOLDEN CONVERSATION (Expected Path):
 {golden_transcript}
 
@@ -83,8 +59,8 @@ Return ONLY this JSON:
     "what_to_improve": "Specific actionable improvements needed"
   }}
 }}"""
-                if rt == "synthetic":
-                    return f"""
+
+_SYNTH_TMPL = """
 ACTUAL CONVERSATION:
 {actual_transcript}
 
@@ -109,9 +85,9 @@ Return ONLY this JSON:
     "what_to_improve": "Actionable bullets"
   }}
 }}"""
-                if rt == "dynamic":
-                    return f"""
-SCENARIO: {scenario or "Unknown"}
+
+_DYN_TMPL = """
+SCENARIO: {scenario}
 
 ACTUAL CONVERSATION:
 {actual_transcript}
@@ -139,8 +115,8 @@ Return ONLY this JSON:
     "what_to_improve": "Specific actionable improvements needed"
   }}
 }}"""
-                if rt == "translation":
-                    return f"""
+
+_TRANS_TMPL = """
 ACTUAL CONVERSATION (Translated/Non-English context):
 {actual_transcript}
 
@@ -166,7 +142,74 @@ Return ONLY this JSON:
   }}
 }}"""
 
-            prompt = build_prompt()
+_PROMPTS = {
+    "human": _HUMAN_TMPL,
+    "synthetic": _SYNTH_TMPL,
+    "dynamic": _DYN_TMPL,
+    "translation": _TRANS_TMPL,
+}
+
+
+class OpenAIService:
+    """Service for OpenAI API integration and conversation evaluation"""
+    
+    def __init__(self, options: Dict[str, Any]):
+        api_key = options.get('api_key')
+        model = options.get('model')
+        temperature = options.get('temperature')
+        
+        if not api_key:
+            raise ValueError('OpenAI API key is required')
+        
+        self.model = model or 'gpt-4o'
+        self.temperature = float(temperature) if temperature is not None else 0.2
+        
+        # One pooled HTTP client per service; HTTP/2 only when the h2 extra is installed
+        self.http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(60.0)
+        )
+        self.openai = AsyncOpenAI(
+            api_key=api_key,
+            http_client=self.http_client
+        )
+
+    async def close(self) -> None:
+        """Close the underlying OpenAI/HTTP client"""
+        await self.openai.close()
+    
+    async def evaluate_conversation(
+        self, 
+        actual_transcript: str, 
+        golden_transcript: str, 
+        test_id: str, 
+        channel_id: str,
+        run_type: str = "human",
+        scenario: Optional[str] = None
+    ) -> Dict:
+        """Evaluate if the actual conversation followed the golden conversation path"""
+        try:
+            Logger.info('🔍 Starting LLM conversation evaluation...')
+            # Logger.info(
+            #     f"""
+            #     actual_transcript: {actual_transcript}
+            #     golden_transcript: {golden_transcript}
+            #     test_id: {test_id}
+            #     channel_id: {channel_id}
+            #     run_type: {run_type}
+            #     scenario: {scenario}
+            #     """
+            # )
+            
+            prompt = _PROMPTS[(run_type or "human").lower()].format_map(defaultdict(
+                str,
+                actual_transcript=actual_transcript,
+                golden_transcript=golden_transcript,
+                test_id=test_id,
+                channel_id=channel_id,
+                scenario=scenario or "Unknown"
+            ))
 
             completion = await self.openai.chat.completions.create(
                 model=self.model,
@@ -184,13 +227,14 @@ Return ONLY this JSON:
                 max_tokens=1000
             )
 
-            evaluation_text = completion.choices[0].message.content.strip()
+            # Parsers tolerate surrounding whitespace, so no strip() copy is needed
+            evaluation_text = completion.choices[0].message.content or ""
             
             # Try to extract JSON from the response
             evaluation_result = None
             try:
                 # First, try parsing as-is
-                evaluation_result = json.loads(evaluation_text)
+                evaluation_result = _json_loads(evaluation_text)
                 
             except json.JSONDecodeError:
                 # If that fails, try to extract JSON from the text
@@ -198,10 +242,9 @@ Return ONLY this JSON:
                 
                 try:
                     # Look for JSON block between { and }
-                    import re
-                    json_match = re.search(r'\{[\s\S]*\}', evaluation_text)
+                    json_match = _JSON_BLOCK_RE.search(evaluation_text)
                     if json_match:
-                        evaluation_result = json.loads(json_match.group(0))
+                        evaluation_result = _json_loads(json_match.group(0))
                         Logger.info('✅ Successfully extracted JSON from response')
                     else:
                         raise ValueError('No JSON block found in response')
@@ -209,29 +252,36 @@ Return ONLY this JSON:
                     Logger.error('❌ Failed to parse evaluation JSON:', str(extract_error))
                     Logger.error('❌ Failed to extract JSON:', str(extract_error))
                     Logger.error('Raw response:', evaluation_text[:500] + '...')
-                    
-                    # Fallback result if JSON parsing fails
-                    return {
-                        'success': False,
-                        'error': 'Failed to parse evaluation response',
-                        'fallback_result': {
-                            'test_id': test_id,
-                            'channelId': channel_id,
-                            'scenario': "Evaluation parsing failed",
-                            'scenario_result': "fail",
-                            'transcript': actual_transcript,
-                            'golden_transcript': golden_transcript,
-                            'cover_story': {
-                                'failure_reason': "LLM evaluation response could not be parsed",
-                                'what_went_well': "Audio files were sent successfully",
-                                'what_to_improve': "Fix evaluation response parsing"
-                            }
-                        },
-                        'raw_response': evaluation_text
-                    }
+                    evaluation_result = None
+            
+            if not isinstance(evaluation_result, dict):
+                # Fallback result if JSON parsing fails
+                return {
+                    'success': False,
+                    'error': 'Failed to parse evaluation response',
+                    'fallback_result': {
+                        'test_id': test_id,
+                        'channelId': channel_id,
+                        'scenario': "Evaluation parsing failed",
+                        'scenario_result': "fail",
+                        'transcript': actual_transcript,
+                        'golden_transcript': golden_transcript,
+                        'cover_story': {
+                            'failure_reason': "LLM evaluation response could not be parsed",
+                            'what_went_well': "Audio files were sent successfully",
+                            'what_to_improve': "Fix evaluation response parsing"
+                        }
+                    },
+                    'raw_response': evaluation_text
+                }
+            
+            missing = [key for key in _REQUIRED_EVALUATION_KEYS if key not in evaluation_result]
+            if missing:
+                Logger.warning(f"⚠️ Evaluation response missing keys: {', '.join(missing)}")
             
             # Ensure the transcript is properly set
-            if not evaluation_result.get('transcript') or evaluation_result['transcript'] == "Copy the actual conversation transcript here":
+            transcript = evaluation_result.get('transcript')
+            if not transcript or transcript in _TRANSCRIPT_PLACEHOLDERS:
                 evaluation_result['transcript'] = actual_transcript
 
             # Add the golden transcript only for human runs
@@ -314,4 +364,34 @@ Return ONLY this JSON:
             return {"success": True, "text": text}
         except Exception as error:
             Logger.error('❌ LLM next-utterance error:', str(error))
-            return {"success": False, "error": str(error)}
\ No newline at end of file
+            return {"success": False, "error": str(error)}
+
+
+# Shared service instances keyed by (event loop, api_key, model, temperature).
+# httpx clients are bound to the loop they were first used on, so each loop gets its own.
+_SERVICES: Dict[tuple, OpenAIService] = {}
+
+
+def get_openai_service(options: Dict[str, Any]) -> OpenAIService:
+    """Return a shared OpenAIService for the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _SERVICES if k[0].is_closed()]:
+        del _SERVICES[key]
+
+    key = (loop, options.get('api_key'), options.get('model'), options.get('temperature'))
+    service = _SERVICES.get(key)
+    if service is None:
+        service = OpenAIService(options)
+        _SERVICES[key] = service
+    return service
+
+
+async def close_openai_services() -> None:
+    """Close all shared OpenAIService instances bound to the running event loop"""
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _SERVICES if k[0] is loop]:
+        service = _SERVICES.pop(key)
+        try:
+            await service.close()
+        except Exception as error:
+            Logger.warning(f"⚠️ Failed to close OpenAI client: {error}")
@@ -14,31 +14,49 @@ class DownloadService:
     """Service for downloading audio files"""
     
     @staticmethod
-    def clear_audio_directory():
+    def _remove_file(path: str, name: str) -> None:
+        """Remove a single file, warning (not raising) on failure"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            Logger.warning(f"⚠️ Could not remove {name}: {e}")
+    
+    @staticmethod
+    async def clear_audio_directory():
         """Clear all files in the audio steps directory"""
         try:
             # Ensure directory exists
             PATHS.AUDIO_STEPS.mkdir(parents=True, exist_ok=True)
             
-            # Get all files in the directory
-            audio_files = list(PATHS.AUDIO_STEPS.glob("*.mp3"))
+            # Single directory scan; DirEntry avoids building Path objects
+            with os.scandir(PATHS.AUDIO_STEPS) as it:
+                entries = [e for e in it if e.name.endswith('.mp3') and e.is_file()]
             
-            if audio_files:
+            if entries:
                 
-                # Remove each file
-                for file_path in audio_files:
-                    try:
-                        file_path.unlink()
-                    except Exception as e:
-                        Logger.warning(f"⚠️ Could not remove {file_path.name}: {e}")
+                # Remove files concurrently in worker threads
+                await asyncio.gather(*[
+                    asyncio.to_thread(DownloadService._remove_file, e.path, e.name) for e in entries
+                ])
                 
-                Logger.success(f"✅ Cleared {len(audio_files)} existing audio files")
+                Logger.success(f"✅ Cleared {len(entries)} existing audio files")
             else:
                 Logger.info("📁 Audio directory is already empty")
                 
         except Exception as error:
             Logger.error(f"❌ Error clearing audio directory: {error}")
     
+    @staticmethod
+    def _fetch_to_file(audio_url: str, file_path: Path) -> int:
+        """Blocking GET of audio_url into file_path; returns the number of bytes written"""
+        response = requests.get(audio_url, timeout=30)
+        response.raise_for_status()
+        with open(file_path, 'wb') as f:
+            f.write(response.content)
+        return len(response.content)
+    
     @staticmethod
     async def download_audio_file(audio_url: str, step_name: str, config) -> Dict:
         """Download a single audio file"""
@@ -52,15 +70,8 @@ class DownloadService:
             
             Logger.info(f"📥 Downloading {step_name}")
             
-            # Download the file
-            response = requests.get(audio_url, timeout=30)
-            response.raise_for_status()
-            
-            # Save the file
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-            
-            file_size = len(response.content)
+            # Download and save the file in a worker thread so downloads can overlap
+            file_size = await asyncio.to_thread(DownloadService._fetch_to_file, audio_url, file_path)
             Logger.success(f"✅ Downloaded {step_name} ({file_size} bytes)")
             
             return {
@@ -85,34 +96,44 @@ class DownloadService:
     @staticmethod
     async def download_all_step_audio(step_audio: Dict, config) -> List[Dict]:
         """Download all step audio files"""
-        download_results = []
         total_steps = len(step_audio)
         
+        # Partition up-front: only steps with a URL are downloaded
+        to_download = [(name, data['audio_url']) for name, data in step_audio.items() if data.get('audio_url')]
+        missing_results = {
+            name: {
+                'success': False,
+                'step': name,
+                'error': 'No audio URL available',
+                'timestamp': Logger._timestamp()
+            }
+            for name, data in step_audio.items() if not data.get('audio_url')
+        }
+        for name in missing_results:
+            Logger.warning(f"⚠️ No audio URL found for {name}")
+        
         # Clear existing audio files before downloading new ones
-        DownloadService.clear_audio_directory()
+        await DownloadService.clear_audio_directory()
         
-        Logger.info(f"📥 Starting download of {total_steps} audio files...")
+        Logger.info(f"📥 Starting download of {len(to_download)} audio files...")
         
-        for step_name, step_data in step_audio.items():
-            if step_data.get('audio_url'):
-                result = await DownloadService.download_audio_file(
-                    step_data['audio_url'],
-                    step_name,
-                    config
-                )
-                download_results.append(result)
-                
-                # Show progress
-                current = len(download_results)
-                Logger.progress(current, total_steps, f"Downloaded {current}/{total_steps}")
-            else:
-                Logger.warning(f"⚠️ No audio URL found for {step_name}")
-                download_results.append({
-                    'success': False,
-                    'step': step_name,
-                    'error': 'No audio URL available',
-                    'timestamp': Logger._timestamp()
-                })
+        semaphore = asyncio.Semaphore(DEFAULTS.MAX_CONCURRENT_DOWNLOADS)
+        
+        async def _download(step_name: str, audio_url: str) -> Dict:
+            async with semaphore:
+                return await DownloadService.download_audio_file(audio_url, step_name, config)
+        
+        results_by_step: Dict[str, Dict] = {}
+        for future in asyncio.as_completed([_download(name, url) for name, url in to_download]):
+            result = await future
+            results_by_step[result['step']] = result
+            
+            # Show progress
+            current = len(results_by_step)
+            Logger.progress(current, len(to_download), f"Downloaded {current}/{len(to_download)}")
+        
+        # Keep step order so audio is sent in conversation order
+        download_results = [results_by_step.get(name) or missing_results[name] for name in step_audio]
         
         Logger.success(f"✅ Download completed: {len([r for r in download_results if r['success']])}/{total_steps} successful")
-        return download_results 
\ No newline at end of file
+        return download_results
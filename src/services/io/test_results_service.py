@@ -1,30 +1,44 @@
 """
 Test Results Service - Handles test result processing and evaluation
 """
+import asyncio
 import json
 import os
 import re
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 from src.utils.logger import Logger
 from src.models.types import PATHS
 
+# Scenario results encoded as the final filename segment of saved test results
+RESULT_SUFFIXES = ('pass', 'fail', 'unknown')
+
 class TestResultsService:
     """Service for managing test results and evaluation data"""
     
     @staticmethod
     def generate_test_id(conversation_id: str) -> str:
         """Generate a unique test ID"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
         return f"test_{conversation_id}_{timestamp}"
     
     @staticmethod
-    def read_conversation_history(file_path: str) -> Optional[str]:
-        """Read conversation history from file"""
+    def _read_text(file_path: str) -> str:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    @staticmethod
+    def _write_json(file_path: Path, data: Dict) -> None:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    
+    @staticmethod
+    async def read_conversation_history(file_path: str) -> Optional[str]:
+        """Read conversation history from file without blocking the event loop"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return await asyncio.to_thread(TestResultsService._read_text, file_path)
         except Exception as error:
             Logger.error(f"❌ Error reading conversation history {file_path}: {error}")
             return None
@@ -64,6 +78,7 @@ class TestResultsService:
     def create_test_summary(evaluation_result: Dict, metadata: Dict) -> Dict:
         """Create a comprehensive test summary"""
         timestamp = datetime.now().isoformat()
+        cover_story = evaluation_result.get('cover_story') or {}
         
         # Extract key information from evaluation result
         test_summary = {
@@ -74,9 +89,9 @@ class TestResultsService:
             'transcript': evaluation_result.get('transcript', ''),
             'golden_transcript': evaluation_result.get('golden_transcript', ''),
             'evaluation_details': {
-                'failure_reason': evaluation_result.get('cover_story', {}).get('failure_reason', ''),
-                'what_went_well': evaluation_result.get('cover_story', {}).get('what_went_well', ''),
-                'what_to_improve': evaluation_result.get('cover_story', {}).get('what_to_improve', '')
+                'failure_reason': cover_story.get('failure_reason', ''),
+                'what_went_well': cover_story.get('what_went_well', ''),
+                'what_to_improve': cover_story.get('what_to_improve', '')
             },
             'metadata': {
                 'duration_ms': metadata.get('duration', 0),
@@ -96,14 +111,17 @@ class TestResultsService:
             # Ensure test results directory exists
             PATHS.TEST_RESULTS.mkdir(parents=True, exist_ok=True)
             
-            # Generate filename
-            timestamp = datetime.now().isoformat().replace(':', '-').replace('.', '-')
-            filename = f"test_result_{conversation_id}_{timestamp}.json"
+            # Generate filename (filesystem-safe ISO-like timestamp, formatted once).
+            # The scenario result is encoded as a suffix so summaries need not open the file.
+            timestamp = datetime.now().strftime('%Y-%m-%dT%H-%M-%S-%f')
+            result = str(test_result.get('scenario_result', 'unknown')).lower()
+            if result not in RESULT_SUFFIXES:
+                result = 'unknown'
+            filename = f"test_result_{conversation_id}_{timestamp}_{result}.json"
             file_path = PATHS.TEST_RESULTS / filename
             
-            # Save to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(test_result, f, indent=2, ensure_ascii=False)
+            # Save to file in a worker thread so concurrent runs are not blocked
+            await asyncio.to_thread(TestResultsService._write_json, file_path, test_result)
             
             Logger.success(f"✅ Test result saved to: {filename}")
             
@@ -126,7 +144,11 @@ class TestResultsService:
     def get_test_results_summary() -> Dict:
         """Get a summary of all test results"""
         try:
-            test_files = os.path.glob(str(PATHS.TEST_RESULTS / "test_result_*.json"))
+            with os.scandir(PATHS.TEST_RESULTS) as it:
+                test_files = [
+                    e for e in it
+                    if e.name.startswith('test_result_') and e.name.endswith('.json') and e.is_file()
+                ]
             
             if not test_files:
                 return {
@@ -141,8 +163,18 @@ class TestResultsService:
             failed_tests = 0
             
             for test_file in test_files:
+                # Fast path: result encoded in the filename (test_result_<id>_<ts>_<result>.json)
+                result = test_file.name[:-len('.json')].rsplit('_', 1)[-1]
+                if result in RESULT_SUFFIXES:
+                    if result == 'pass':
+                        passed_tests += 1
+                    else:
+                        failed_tests += 1
+                    continue
+                
+                # Legacy filenames without a result suffix: read the JSON
                 try:
-                    with open(test_file, 'r', encoding='utf-8') as f:
+                    with open(test_file.path, 'r', encoding='utf-8') as f:
                         test_data = json.load(f)
                         if test_data.get('scenario_result') == 'pass':
                             passed_tests += 1
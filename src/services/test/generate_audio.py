@@ -1,5 +1,8 @@
 import os
+import sys
 import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from gtts import gTTS
 from pydub import AudioSegment
 from TTS.api import TTS as CoquiTTS
@@ -55,8 +58,33 @@ def generate_melotts(text):
     print(f"✅ All MeloTTS audio files saved in '{output_dir}/'")
 
 
+ENGINES = {
+    "gtts": generate_gtts,
+    "coqui": generate_coqui_tts,
+    "melo": generate_melotts,
+}
+
+
+def _run(name, text):
+    """Run a single engine by name (module-level so it can be pickled for worker processes)."""
+    ENGINES[name](text)
+
+
+def generate_all(text):
+    """Generate audio with every engine concurrently, one process per engine."""
+    # 'spawn' avoids forking CUDA/torch state into the workers
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(ENGINES), mp_context=ctx) as ex:
+        list(ex.map(_run, ENGINES, [text] * len(ENGINES)))
+
+
 def main():
     text = "Can you please help me confirm my appointment? My date of birth is 1990-01-01 and my name is John Doe."
+
+    if "--all" in sys.argv[1:]:
+        generate_all(text)
+        return
+
     print("Choose engine:\n1) gTTS\n2) CoquiTTS\n3) MeloTTS")
     choice = input("Choice: ").strip()
 
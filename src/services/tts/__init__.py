@@ -8,12 +8,33 @@ This package provides Text-to-Speech functionality using various engines:
 - Edge TTS (Microsoft)
 """
 
-from .base_tts_service import BaseTTSService
-from .google_tts_service import GoogleTTSService
-from .coqui_tts_service import CoquiTTSService
-from .melotts_service import MeloTTSService
-from .edgetts_service import EdgeTTSService
-from .tts_utils import synthesize_steps, list_speakers
+import importlib
+
+# Exports resolve on first attribute access (PEP 562), so importing one engine or tts_utils
+# does not load every engine's stack (Coqui/MeloTTS pull in torch)
+_LAZY_EXPORTS = {
+    "BaseTTSService": ".base_tts_service",
+    "GoogleTTSService": ".google_tts_service",
+    "CoquiTTSService": ".coqui_tts_service",
+    "MeloTTSService": ".melotts_service",
+    "EdgeTTSService": ".edgetts_service",
+    "synthesize_steps": ".tts_utils",
+    "list_speakers": ".tts_utils",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "BaseTTSService",
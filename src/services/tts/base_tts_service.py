@@ -5,14 +5,27 @@ This module provides the base interface that all TTS services should implement
 to ensure consistency across different TTS engines.
 """
 
+import asyncio
+import hashlib
+import itertools
+import os
+import shutil
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
 
 
 class BaseTTSService(ABC):
     """Base interface for all TTS services."""
     
+    # On-disk synthesis cache shared by all engines and processes. LRU order is the files'
+    # mtime (bumped on every hit), so it survives restarts and spans pool workers
+    CACHE_DIR = Path("~/.cache/tts_cache").expanduser()
+    CACHE_MAX_ENTRIES = 128
+    _cache_lock = threading.Lock()
+    
     def __init__(
         self,
         language: str = "en",
@@ -28,6 +41,29 @@ class BaseTTSService(ABC):
         self.emotion = emotion
         self.sample_rate = sample_rate
         self._model = None
+        # Distinguishes output files of repeated/concurrent synthesize() calls
+        self._run_counter = itertools.count()
+        # Bounded pool for blocking work (model calls, decoding); created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def _uses_gpu(self) -> bool:
+        """Whether blocking work runs on a GPU; engines with local models override this."""
+        return False
+    
+    def _concurrency(self) -> int:
+        """Worker threads for blocking work: 1 on GPU (serialize kernels), up to 4 on CPU."""
+        return 1 if self._uses_gpu() else min(4, os.cpu_count() or 1)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._concurrency(), thread_name_prefix=type(self).__name__
+            )
+        return self._executor
+    
+    async def _run_blocking(self, fn: Callable, *args: Any) -> Any:
+        """Run fn(*args) on this service's bounded executor."""
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
     
     @abstractmethod
     async def synthesize(self, texts: List[str], output_dir: Path) -> List[Path]:
@@ -77,6 +113,116 @@ class BaseTTSService(ABC):
         """
         pass
     
+    async def aclose(self) -> None:
+        """Release engine resources (network connections, pools). No-op by default."""
+        pass
+    
+    def _step_paths(self, output_dir: Path, count: int) -> List[Path]:
+        """Output paths for one synthesize() run: step_{run_id}_{index}.wav."""
+        run_id = next(self._run_counter)
+        return [output_dir / f"step_{run_id}_{index}.wav" for index in range(1, count + 1)]
+    
+    @staticmethod
+    def clear_outputs(output_dir: Path) -> int:
+        """
+        Delete previously generated WAV files from output_dir.
+        
+        synthesize() never deletes anything; call this when a directory should
+        only hold the latest run.
+        
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".wav") and entry.is_file():
+                        try:
+                            os.unlink(entry.path)
+                            removed += 1
+                        except FileNotFoundError:
+                            pass
+        except FileNotFoundError:
+            pass
+        return removed
+    
+    def _cache_identity(self) -> Tuple:
+        """
+        Parameters that affect the synthesized audio, used in the cache key.
+        
+        Subclasses with extra engine-specific settings should extend this tuple.
+        """
+        return (type(self).__name__, self.language, self.speaker, self.speed, self.emotion, self.sample_rate)
+    
+    def _cache_key(self, text: str) -> str:
+        identity = "|".join(str(part) for part in self._cache_identity())
+        return hashlib.md5(f"{text}|{identity}".encode("utf-8")).hexdigest()
+    
+    def _cache_fetch(self, text: str, output_path: Path) -> bool:
+        """
+        Copy a cached rendering of text to output_path.
+        
+        Returns:
+            True on a cache hit, False if the text still needs synthesizing
+        """
+        key = self._cache_key(text)
+        cached = self.CACHE_DIR / f"{key}.wav"
+        try:
+            if not cached.exists():
+                return False
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, output_path)
+            # Mark as most recently used
+            os.utime(cached)
+        except Exception:
+            return False
+        return True
+    
+    def _cache_store(self, text: str, output_path: Path) -> None:
+        """Store a freshly synthesized file in the cache (best-effort)."""
+        key = self._cache_key(text)
+        cached = self.CACHE_DIR / f"{key}.wav"
+        # Written under a unique temp name and renamed atomically, so another process
+        # never copies a half-written WAV
+        tmp = self.CACHE_DIR / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, tmp)
+            os.replace(tmp, cached)
+        except Exception:
+            try:
+                tmp.unlink(missing_ok=True)
+            except Exception:
+                pass
+            return
+        self._cache_evict()
+    
+    @classmethod
+    def _cache_evict(cls) -> None:
+        """Delete the least recently used WAVs beyond CACHE_MAX_ENTRIES.
+        
+        Works from the directory listing rather than in-memory state, so entries written by
+        earlier runs or other processes are evicted too.
+        """
+        with BaseTTSService._cache_lock:
+            try:
+                with os.scandir(cls.CACHE_DIR) as entries:
+                    files = [(entry.stat().st_mtime_ns, entry.path) for entry in entries
+                             if entry.name.endswith(".wav") and entry.is_file()]
+            except OSError:
+                return
+            excess = len(files) - cls.CACHE_MAX_ENTRIES
+            if excess <= 0:
+                return
+            files.sort()
+            for _, path in files[:excess]:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    # Already evicted by another process
+                    pass
+    
     def get_service_info(self) -> Dict[str, Any]:
         """
         Get information about this TTS service.
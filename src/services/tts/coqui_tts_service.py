@@ -1,15 +1,52 @@
 import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydub import AudioSegment
+import numpy as np
+import soundfile as sf
 
 from .base_tts_service import BaseTTSService
+from .tts_utils import resample_to_pcm16
 from ...utils.tts_config import setup_tts_environment
 
 # Setup TTS environment to prevent warnings
 setup_tts_environment()
 
+# XTTS conditioning latents keyed by (reference wav path, model name); computing
+# them re-encodes the reference audio, so do it once per voice per process.
+_COND_LATENTS_CACHE: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+
+# Bundled XTTS reference voice (src/services/output/CoquiTTS/voice.wav), resolved once at import
+_DEFAULT_REF_WAV = (Path(__file__).resolve().parent.parent / "output" / "CoquiTTS" / "voice.wav")
+_DEFAULT_REF_WAV_EXISTS = _DEFAULT_REF_WAV.exists()
+
+# Loaded models shared by every instance in the process, keyed by (requested model, int8):
+# value is (TTS model, model name actually loaded, speaker list)
+_MODEL_REGISTRY: Dict[Tuple[str, bool], Tuple[Any, str, Optional[List[str]]]] = {}
+_MODEL_LOCK = threading.Lock()
+# Models are not safe to drive concurrently, and instances share them, so they share one worker too
+_INFERENCE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coqui-tts")
+
+# ONNX Runtime sessions for exported vocoders, keyed by .onnx path
+_ORT_SESSIONS: Dict[str, Any] = {}
+
+# Warm CPU worker pools keyed by service configuration, shared across instances
+_PROCESS_POOLS: Dict[Tuple, ProcessPoolExecutor] = {}
+# The service owned by this process when running as a pool worker (see _warm_worker)
+_WORKER_SERVICE: Optional["CoquiTTSService"] = None
+
+# Emotion -> (speed_factor, pitch_semitones)
+_COQUI_EMOTIONS: Dict[str, Tuple[float, float]] = {
+    **dict.fromkeys(("happy", "excited", "cheerful"), (1.10, +2.0)),
+    **dict.fromkeys(("sad", "melancholic"), (0.95, -2.0)),
+    **dict.fromkeys(("angry", "furious"), (1.12, +1.0)),
+    **dict.fromkeys(("calm", "serene"), (0.98, -1.0)),
+    **dict.fromkeys(("serious", "neutral"), (1.0, 0.0)),
+}
+
 
 class CoquiTTSService(BaseTTSService):
     """Coqui TTS wrapper with optional prosody adjustments for emotion.
@@ -28,6 +65,10 @@ class CoquiTTSService(BaseTTSService):
         emotion: Optional[str] = None,
         sample_rate: int = 24000,
         model_name: Optional[str] = None,
+        workers: int = 1,
+        enable_int8: bool = False,
+        backend: str = "torch",
+        onnx_path: Optional[str] = None,
         **kwargs
     ) -> None:
         super().__init__(language, speaker, speed, emotion, sample_rate, **kwargs)
@@ -37,44 +78,304 @@ class CoquiTTSService(BaseTTSService):
         # See: https://coqui.ai/docs/tts/models/xtts
         self.model_name = model_name or "tts_models/multilingual/multi-dataset/xtts_v2"
         self._available_speakers: Optional[List[str]] = None
+        # Single dedicated worker + semaphore: the model is not safe to drive concurrently
+        self._executor = _INFERENCE_EXECUTOR
+        self._model_sem = asyncio.Semaphore(1)
+        # CPU-only: >1 runs inference in that many processes, each holding its own warmed
+        # model (mind the memory; XTTS is ~2 GB per process). GPU runs stay in-process.
+        self.workers = max(1, int(workers or 1))
+        self._pool_sem = asyncio.Semaphore(self.workers)
+        # Opt-in: dynamic int8 changes the synthesized audio and has not been validated
+        # against FP32 output for the XTTS decoder yet
+        self.enable_int8 = bool(enable_int8)
+        # "onnx": run the XTTS HiFi-GAN vocoder through ONNX Runtime (CUDA when available).
+        # The autoregressive GPT decoder stays in PyTorch; it is not exportable as a graph.
+        self.backend = (backend or "torch").strip().lower()
+        safe_model = self.model_name.replace("/", "_")
+        self.onnx_path = Path(onnx_path or f"~/.cache/coqui_onnx/{safe_model}_hifigan.onnx").expanduser()
+        self._init_kwargs = {
+            "language": language,
+            "speaker": speaker,
+            "speed": speed,
+            "emotion": emotion,
+            "sample_rate": sample_rate,
+            "model_name": self.model_name,
+            "enable_int8": self.enable_int8,
+            "backend": self.backend,
+            "onnx_path": str(self.onnx_path),
+        }
+
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Shared pool of warmed worker processes, or None to synthesize in-process."""
+        if self.workers <= 1:
+            return None
+        try:
+            import torch  # type: ignore
+            if torch.cuda.is_available():
+                return None
+        except Exception:
+            pass
+        key = tuple(sorted(self._init_kwargs.items())) + (self.workers,)
+        pool = _PROCESS_POOLS.get(key)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+                initargs=(self._init_kwargs,),
+            )
+            _PROCESS_POOLS[key] = pool
+        return pool
 
     def _ensure_model(self) -> None:
         if self._model is None:
-            try:
-                from TTS.api import TTS  # type: ignore
-            except Exception as error:
-                raise ModuleNotFoundError(
-                    "Coqui TTS is not installed. Install via 'pip install TTS' and ensure torch is available."
-                ) from error
-            self._model = TTS(self.model_name)
-            # Detect XTTS environment incompatibility (missing generate) and fall back
-            try:
-                synthesizer = getattr(self._model, "synthesizer", None)
-                tts_model = getattr(synthesizer, "tts_model", None)
-                gpt = getattr(tts_model, "gpt", None)
-                gpt_infer = getattr(gpt, "gpt_inference", None)
-                if gpt_infer is not None and not hasattr(gpt_infer, "generate"):
-                    # Switch to a stable single-speaker English model
-                    fallback_model = "tts_models/en/ljspeech/tacotron2-DDC"
-                    self._model = TTS(fallback_model)
-                    self.model_name = fallback_model
-                    self._available_speakers = None
-            except Exception:
-                # If any inspection fails, proceed with current model; runtime will handle retries
-                pass
-            # Cache speaker list if available (XTTS v2 exposes speakers)
-            try:
-                spk_list = getattr(self._model, "speakers", None)
-                if isinstance(spk_list, list) and spk_list:
-                    self._available_speakers = spk_list
-                if not self._available_speakers:
-                    sm = getattr(self._model, "speaker_manager", None)
-                    if sm is not None:
-                        sm_speakers = getattr(sm, "speakers", None)
-                        if isinstance(sm_speakers, dict) and len(sm_speakers) > 0:
-                            self._available_speakers = list(sm_speakers.keys())
-            except Exception:
+            # One load per (model, quantization) per process, however many services exist
+            with _MODEL_LOCK:
+                key = (self.model_name, self.enable_int8)
+                entry = _MODEL_REGISTRY.get(key)
+                if entry is None:
+                    self._load_model()
+                    entry = _MODEL_REGISTRY[key] = (self._model, self.model_name, self._available_speakers)
+            self._model, self.model_name, self._available_speakers = entry
+
+    def _load_model(self) -> None:
+        """Load the model, applying the XTTS fallback, int8 quantization and speaker discovery."""
+        try:
+            from TTS.api import TTS  # type: ignore
+        except Exception as error:
+            raise ModuleNotFoundError(
+                "Coqui TTS is not installed. Install via 'pip install TTS' and ensure torch is available."
+            ) from error
+        self._model = TTS(self.model_name)
+        # Detect XTTS environment incompatibility (missing generate) and fall back
+        try:
+            synthesizer = getattr(self._model, "synthesizer", None)
+            tts_model = getattr(synthesizer, "tts_model", None)
+            gpt = getattr(tts_model, "gpt", None)
+            gpt_infer = getattr(gpt, "gpt_inference", None)
+            if gpt_infer is not None and not hasattr(gpt_infer, "generate"):
+                # Switch to a stable single-speaker English model
+                fallback_model = "tts_models/en/ljspeech/tacotron2-DDC"
+                self._model = TTS(fallback_model)
+                self.model_name = fallback_model
                 self._available_speakers = None
+        except Exception:
+            # If any inspection fails, proceed with current model; runtime will handle retries
+            pass
+        if self.enable_int8:
+            self._quantize_for_cpu()
+        # Cache speaker list if available (XTTS v2 exposes speakers)
+        try:
+            spk_list = getattr(self._model, "speakers", None)
+            if isinstance(spk_list, list) and spk_list:
+                self._available_speakers = spk_list
+            if not self._available_speakers:
+                sm = getattr(self._model, "speaker_manager", None)
+                if sm is not None:
+                    sm_speakers = getattr(sm, "speakers", None)
+                    if isinstance(sm_speakers, dict) and len(sm_speakers) > 0:
+                        self._available_speakers = list(sm_speakers.keys())
+        except Exception:
+            self._available_speakers = None
+
+    @staticmethod
+    def _conv1d_to_linear(module: Any, torch: Any, converted: Optional[Dict[int, Any]] = None) -> None:
+        """Replace transformers Conv1D layers (GPT-2 attention/MLP projections) with nn.Linear.
+
+        Conv1D computes x @ W + b with W shaped (in, out), so it is an nn.Linear with the
+        weight transposed; quantize_dynamic only recognizes the latter. Shared submodules
+        (XTTS's gpt_inference reuses the GPT-2 blocks) map to the same replacement.
+        """
+        try:
+            from transformers.pytorch_utils import Conv1D  # type: ignore
+        except Exception:
+            return
+        if converted is None:
+            converted = {}
+        for name, child in list(module.named_children()):
+            if isinstance(child, Conv1D):
+                linear = converted.get(id(child))
+                if linear is None:
+                    in_features, out_features = child.weight.shape
+                    linear = torch.nn.Linear(in_features, out_features)
+                    with torch.no_grad():
+                        linear.weight.copy_(child.weight.t())
+                        linear.bias.copy_(child.bias)
+                    converted[id(child)] = linear
+                setattr(module, name, linear)
+            else:
+                CoquiTTSService._conv1d_to_linear(child, torch, converted)
+
+    def _quantize_for_cpu(self) -> None:
+        """Swap the model's linear layers (including the GPT decoder's Conv1D projections) for
+        dynamic int8 kernels when running on CPU."""
+        try:
+            import torch  # type: ignore
+            if torch.cuda.is_available():
+                return
+            synthesizer = self._model.synthesizer
+            # The XTTS GPT decoder is HF GPT-2, whose projections are Conv1D, not nn.Linear
+            self._conv1d_to_linear(synthesizer.tts_model, torch)
+            # In place, so the FP32 weights are not kept alongside the quantized copy
+            torch.quantization.quantize_dynamic(
+                synthesizer.tts_model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+        except Exception:
+            # Quantization is an optimization only; keep the FP32 model if it is unsupported
+            pass
+
+    def _cache_identity(self) -> Tuple:
+        return super()._cache_identity() + (self.model_name, self.requested_speed, self.enable_int8, self.backend)
+
+    def _get_conditioning_latents(self, ref_wav: str) -> Optional[Tuple[Any, Any]]:
+        """Return cached (gpt_cond_latent, speaker_embedding) for an XTTS reference wav."""
+        key = (ref_wav, self.model_name)
+        if key in _COND_LATENTS_CACHE:
+            return _COND_LATENTS_CACHE[key]
+        if "xtts" not in (self.model_name or ""):
+            return None
+        try:
+            tts_model = self._model.synthesizer.tts_model
+            latents = tts_model.get_conditioning_latents(audio_path=[ref_wav])
+        except Exception:
+            return None
+        _COND_LATENTS_CACHE[key] = latents
+        return latents
+
+    def _get_ort_session(self, example_inputs: Tuple[Any, Any]) -> Optional[Any]:
+        """Load (exporting on first use) the ONNX vocoder session; None if unavailable."""
+        key = str(self.onnx_path)
+        if key in _ORT_SESSIONS:
+            return _ORT_SESSIONS[key]
+        try:
+            import onnxruntime as ort  # type: ignore
+            import torch  # type: ignore
+
+            if not self.onnx_path.exists():
+                self.onnx_path.parent.mkdir(parents=True, exist_ok=True)
+                torch.onnx.export(
+                    self._model.synthesizer.tts_model.hifigan_decoder,
+                    example_inputs,
+                    str(self.onnx_path),
+                    input_names=["latents", "g"],
+                    output_names=["wav"],
+                    dynamic_axes={"latents": {0: "batch", 1: "frames"}, "wav": {0: "batch", 2: "samples"}},
+                    opset_version=17,
+                )
+            available = ort.get_available_providers()
+            providers = [p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in available]
+            session = ort.InferenceSession(str(self.onnx_path), providers=providers)
+        except Exception:
+            session = None
+        _ORT_SESSIONS[key] = session
+        return session
+
+    def _vocode(self, gpt_latents: Any, speaker_embedding: Any) -> np.ndarray:
+        """Decode GPT latents to a waveform with the ONNX vocoder when enabled, else PyTorch."""
+        if self.backend == "onnx":
+            session = self._get_ort_session((gpt_latents, speaker_embedding))
+            if session is not None:
+                wav = session.run(None, {
+                    "latents": gpt_latents.detach().cpu().numpy(),
+                    "g": speaker_embedding.detach().cpu().numpy(),
+                })[0]
+                return np.asarray(wav).squeeze()
+        decoder = self._model.synthesizer.tts_model.hifigan_decoder
+        return decoder(gpt_latents, g=speaker_embedding).cpu().squeeze().numpy()
+
+    def _output_rate(self) -> int:
+        return getattr(self._model.synthesizer, "output_sample_rate", 24000)
+
+    def _inference_with_latents(self, text: str, ref_wav: str) -> Optional[np.ndarray]:
+        """Run XTTS inference from cached latents; returns the raw waveform or None if unavailable."""
+        if self.backend == "onnx":
+            # Same GPT decoding as tts_model.inference, but with the swappable vocoder
+            wavs = self._batched_inference_with_latents([text], ref_wav)
+            return wavs[0] if wavs else None
+        latents = self._get_conditioning_latents(ref_wav)
+        if latents is None:
+            return None
+        try:
+            gpt_cond_latent, speaker_embedding = latents
+            out = self._model.synthesizer.tts_model.inference(text, self.language, gpt_cond_latent, speaker_embedding)
+            wav = out["wav"]
+            if hasattr(wav, "cpu"):
+                wav = wav.cpu().numpy()
+            return np.asarray(wav).squeeze()
+        except Exception:
+            return None
+
+    def _batched_inference_with_latents(self, texts: List[str], ref_wav: str) -> Optional[List[np.ndarray]]:
+        """Run XTTS GPT decoding batched over texts of equal token length.
+
+        gpt.generate takes no attention mask, so padded rows would be decoded conditioned on
+        the padding; texts are bucketed by exact token length and each bucket is one
+        unpadded (B, T) generate call.
+
+        Returns the raw waveforms, or None if the model does not expose the XTTS
+        internals this relies on, so the caller can fall back to per-text inference.
+        """
+        latents = self._get_conditioning_latents(ref_wav)
+        if latents is None:
+            return None
+        try:
+            import torch  # type: ignore
+
+            synthesizer = self._model.synthesizer
+            xtts = synthesizer.tts_model
+            gpt = xtts.gpt
+            device = xtts.device
+            language = (self.language or "en").split("-")[0]
+            gpt_cond_latent, speaker_embedding = (t.to(device) for t in latents)
+
+            token_lists = [xtts.tokenizer.encode(text.strip().lower(), lang=language) for text in texts]
+            buckets: Dict[int, List[int]] = {}
+            for row, tokens in enumerate(token_lists):
+                buckets.setdefault(len(tokens), []).append(row)
+
+            wavs: List[Optional[np.ndarray]] = [None] * len(texts)
+            with torch.inference_mode():
+                for length, rows in buckets.items():
+                    input_ids = torch.as_tensor([token_lists[row] for row in rows], dtype=torch.int32, device=device)
+                    # The autoregressive decoder is the expensive part: one generate() call per bucket
+                    codes_batch = gpt.generate(
+                        cond_latents=gpt_cond_latent.expand(len(rows), -1, -1),
+                        text_inputs=input_ids,
+                        input_tokens=None,
+                        do_sample=True,
+                        top_p=0.85,
+                        top_k=50,
+                        temperature=0.75,
+                        num_return_sequences=1,
+                        num_beams=1,
+                        length_penalty=1.0,
+                        repetition_penalty=10.0,
+                        output_attentions=False,
+                    )
+
+                    for index, row in enumerate(rows):
+                        # Trim each sequence at its own stop-audio token
+                        codes = codes_batch[index:index + 1]
+                        stops = (codes[0] == gpt.stop_audio_token).nonzero()
+                        if len(stops) > 0:
+                            codes = codes[:, :int(stops[0]) + 1]
+                        # Same unpadded text tokens the codes were generated from
+                        gpt_latents = gpt(
+                            input_ids[index:index + 1],
+                            torch.tensor([length], device=device),
+                            codes,
+                            torch.tensor([codes.shape[-1] * gpt.code_stride_len], device=device),
+                            cond_latents=gpt_cond_latent,
+                            return_attentions=False,
+                            return_latent=True,
+                        )
+                        # Vocoded per row: latent lengths differ after the stop-token trim, and
+                        # padding them would bleed into each clip's tail through HiFi-GAN's
+                        # receptive field
+                        wavs[row] = self._vocode(gpt_latents, speaker_embedding)
+        except Exception:
+            return None
+        return wavs
 
     def _resolve_speaker(self) -> Optional[str]:
         # Prefer provided speaker if it exists in model inventory
@@ -92,59 +393,64 @@ class CoquiTTSService(BaseTTSService):
     @staticmethod
     def _emotion_to_prosody(emotion: Optional[str]) -> Tuple[float, float]:
         """Map emotion to (speed_factor, pitch_semitones)."""
-        if not emotion:
-            return (1.0, 0.0)
-        e = emotion.strip().lower()
-        if e in {"happy", "excited", "cheerful"}:
-            return (1.10, +2.0)
-        if e in {"sad", "melancholic"}:
-            return (0.95, -2.0)
-        if e in {"angry", "furious"}:
-            return (1.12, +1.0)
-        if e in {"calm", "serene"}:
-            return (0.98, -1.0)
-        if e in {"serious", "neutral"}:
-            return (1.0, 0.0)
-        return (1.0, 0.0)
-
-    @staticmethod
-    def _change_pitch(audio: AudioSegment, semitones: float) -> AudioSegment:
-        if abs(semitones) < 1e-6:
-            return audio
-        # Changing pitch by altering frame rate, then resetting to target sample rate.
-        new_frame_rate = int(audio.frame_rate * (2.0 ** (semitones / 12.0)))
-        shifted = audio._spawn(audio.raw_data, overrides={"frame_rate": new_frame_rate})
-        return shifted.set_frame_rate(audio.frame_rate)
-
-    @staticmethod
-    def _change_speed(audio: AudioSegment, speed: float) -> AudioSegment:
-        if abs(speed - 1.0) < 1e-6:
-            return audio
-        # Speed change by resampling via frame rate hack
-        new_frame_rate = int(audio.frame_rate * speed)
-        sped = audio._spawn(audio.raw_data, overrides={"frame_rate": new_frame_rate})
-        return sped.set_frame_rate(audio.frame_rate)
+        return _COQUI_EMOTIONS.get((emotion or "").strip().lower(), (1.0, 0.0))
 
     async def synthesize(self, texts: List[str], output_dir: Path) -> List[Path]:
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Clear existing files
-        for file in output_dir.glob("*.wav"):
-            file.unlink()
-            
-        file_paths: List[Path] = []
-        for index, text in enumerate(texts, start=1):
-            out_path = output_dir / f"step_{index}.wav"
-            await self.synthesize_single(text, out_path)
-            file_paths.append(out_path)
-            await asyncio.sleep(0)
+        file_paths: List[Path] = self._step_paths(output_dir, len(texts))
+        if self._get_process_pool() is not None:
+            # CPU pool: one step per worker process, in parallel
+            await asyncio.gather(*[
+                self.synthesize_single(text, out_path) for text, out_path in zip(texts, file_paths)
+            ])
+            return file_paths
+        # Submit the whole batch in one executor hop; the model is loaded once and reused
+        async with self._model_sem:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._synthesize_batch_blocking, texts, file_paths
+            )
         return file_paths
 
     async def synthesize_single(self, text: str, output_path: Path) -> Path:
+        if self._cache_fetch(text, output_path):
+            return output_path
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        await asyncio.get_event_loop().run_in_executor(None, self._synthesize_blocking, text, output_path)
+        pool = self._get_process_pool()
+        if pool is not None:
+            async with self._pool_sem:
+                await asyncio.get_running_loop().run_in_executor(pool, _worker_synthesize, text, str(output_path))
+        else:
+            async with self._model_sem:
+                await asyncio.get_running_loop().run_in_executor(self._executor, self._synthesize_blocking, text, output_path)
+        self._cache_store(text, output_path)
         return output_path
 
+    def _synthesize_batch_blocking(self, texts: List[str], output_paths: List[Path]) -> None:
+        """Synthesize all uncached texts on the worker thread; the model loads on the first miss."""
+        misses = [(text, path) for text, path in zip(texts, output_paths) if not self._cache_fetch(text, path)]
+        if not misses:
+            return
+
+        self._ensure_model()
+        ref_wav = self._default_ref_wav() if not self._resolve_speaker() else None
+        if len(misses) > 1 and ref_wav is not None:
+            wavs = self._batched_inference_with_latents([text for text, _ in misses], ref_wav)
+            if wavs is not None:
+                # Post-process straight from memory; no intermediate raw WAVs
+                for (text, path), wav in zip(misses, wavs):
+                    self._write_processed(wav, self._output_rate(), path)
+                    self._cache_store(text, path)
+                return
+
+        for text, output_path in misses:
+            self._synthesize_blocking(text, output_path)
+            self._cache_store(text, output_path)
+
+    @staticmethod
+    def _default_ref_wav() -> Optional[str]:
+        """Path of the bundled XTTS reference voice, if present."""
+        return str(_DEFAULT_REF_WAV) if _DEFAULT_REF_WAV_EXISTS else None
+
     def _synthesize_blocking(self, text: str, output_path: Path) -> None:
         self._ensure_model()
 
@@ -165,22 +471,26 @@ class CoquiTTSService(BaseTTSService):
             kwargs["speaker"] = speaker_name
         else:
             # Fallback to a bundled reference wav for XTTS-like models
-            try:
-                default_ref_wav = (Path(__file__).parent / "output" / "CoquiTTS" / "voice.wav").resolve()
-                if default_ref_wav.exists():
-                    kwargs["speaker_wav"] = str(default_ref_wav)
-            except Exception:
-                pass
+            default_ref_wav = self._default_ref_wav()
+            if default_ref_wav:
+                kwargs["speaker_wav"] = default_ref_wav
+
+        if "speaker_wav" in kwargs:
+            # Reuse cached reference-voice latents (no re-encoding) and skip the temp file
+            wav = self._inference_with_latents(text, kwargs["speaker_wav"])
+            if wav is not None:
+                self._write_processed(wav, self._output_rate(), output_path)
+                return
 
         try:
             # Try with potential parameters; Coqui TTS will ignore unknowns or may raise.
             self._model.tts_to_file(**kwargs)
         except (TypeError, KeyError, ValueError):
             # If failure due to missing/invalid speaker, try with reference wav only
-            ref_wav = (Path(__file__).parent / "output" / "CoquiTTS" / "voice.wav").resolve()
+            ref_wav = self._default_ref_wav()
             try:
-                if ref_wav.exists():
-                    self._model.tts_to_file(text=text, file_path=str(temp_raw), language=self.language, speaker_wav=str(ref_wav))
+                if ref_wav:
+                    self._model.tts_to_file(text=text, file_path=str(temp_raw), language=self.language, speaker_wav=ref_wav)
                 else:
                     # Retry without optional params that may cause issues (speaker/language)
                     self._model.tts_to_file(text=text, file_path=str(temp_raw))
@@ -188,25 +498,29 @@ class CoquiTTSService(BaseTTSService):
                 # Final minimal retry
                 self._model.tts_to_file(text=text, file_path=str(temp_raw))
 
-        # Load and apply prosody adjustments
-        audio = AudioSegment.from_file(temp_raw)
-        audio = audio.set_frame_rate(self.sample_rate).set_channels(1)
-
-        # Combine requested speed with emotion mapping
-        emo_speed, emo_pitch = self._emotion_to_prosody(self.emotion)
-        combined_speed = max(0.5, min(2.0, self.requested_speed * emo_speed))
-
-        if abs(emo_pitch) > 1e-6:
-            audio = self._change_pitch(audio, emo_pitch)
-        if abs(combined_speed - 1.0) > 1e-6:
-            audio = self._change_speed(audio, combined_speed)
+        self._post_process(temp_raw, output_path)
 
-        audio.export(output_path, format="wav")
+    def _post_process(self, temp_raw: Path, output_path: Path) -> None:
+        """Apply speed/emotion prosody and the target sample rate to a raw model WAV file."""
+        samples, raw_rate = sf.read(str(temp_raw), dtype="float32")
+        self._write_processed(samples, raw_rate, output_path)
         try:
             temp_raw.unlink(missing_ok=True)
         except Exception:
             pass
 
+    def _write_processed(self, samples: np.ndarray, raw_rate: int, output_path: Path) -> None:
+        """Apply speed/emotion prosody and the target sample rate to raw samples and write the WAV."""
+        # Combine requested speed with emotion mapping
+        emo_speed, emo_pitch = self._emotion_to_prosody(self.emotion)
+        combined_speed = max(0.5, min(2.0, self.requested_speed * emo_speed))
+
+        # Speed and pitch are both "play faster" factors, so fold them and the
+        # conversion to the target sample rate into a single resample pass.
+        ratio = combined_speed * (2.0 ** (emo_pitch / 12.0))
+        pcm = resample_to_pcm16(samples, int(round(raw_rate * ratio)), self.sample_rate)
+        sf.write(str(output_path), pcm, self.sample_rate, subtype="PCM_16")
+
     def get_available_speakers(self) -> List[str]:
         """Get list of available speakers for Coqui TTS."""
         if self._available_speakers:
@@ -220,3 +534,13 @@ class CoquiTTSService(BaseTTSService):
         ]
 
 
+def _warm_worker(init_kwargs: Dict[str, Any]) -> None:
+    """Pool initializer: build this process's service and load the model once."""
+    global _WORKER_SERVICE
+    _WORKER_SERVICE = CoquiTTSService(**init_kwargs)
+    _WORKER_SERVICE._ensure_model()
+
+
+def _worker_synthesize(text: str, output_path: str) -> None:
+    """Run one synthesis inside a pool worker; the parent handles caching."""
+    _WORKER_SERVICE._synthesize_blocking(text, Path(output_path))
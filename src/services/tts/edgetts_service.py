@@ -5,19 +5,57 @@ This module provides TTS functionality using Microsoft Edge TTS.
 """
 
 import asyncio
-import tempfile
+import io
+import json
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
+import aiohttp
 import edge_tts
-from pydub import AudioSegment
 from xml.sax.saxutils import escape as xml_escape
 
 from .base_tts_service import BaseTTSService
+from .tts_utils import transcode_to_wav
+
+
+# Emotion -> (rate_factor, pitch_percent)
+_EDGE_EMOTIONS: Dict[str, Tuple[float, int]] = {
+    **dict.fromkeys(("happy", "excited", "cheerful"), (1.08, +10)),
+    **dict.fromkeys(("sad", "melancholic"), (0.95, -10)),
+    **dict.fromkeys(("angry", "furious"), (1.05, +5)),
+    **dict.fromkeys(("calm", "serene"), (0.98, -5)),
+    **dict.fromkeys(("serious", "neutral"), (1.0, 0)),
+}
+
+
+class _PersistentConnector(aiohttp.TCPConnector):
+    """TCPConnector that outlives the ClientSession edge_tts opens and closes per stream.
+
+    Sessions own the connector they are given, so ignore their close() and only
+    release connections through shutdown().
+    """
+
+    def close(self, **kwargs):
+        done = asyncio.get_event_loop().create_future()
+        done.set_result(None)
+        return done
+
+    def shutdown(self):
+        return super().close()
 
 
 class EdgeTTSService(BaseTTSService):
     """TTS using Microsoft Edge TTS with voice selection and SSML support."""
 
+    # Maximum number of utterances streamed from the Edge endpoint at once
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # On-disk copy of the (effectively static) voice catalog
+    VOICES_CACHE_PATH = Path("~/.cache/edgetts_voices.json").expanduser()
+    VOICES_CACHE_TTL = 7 * 24 * 3600  # seconds
+
     def __init__(
         self,
         language: str = "en",
@@ -31,18 +69,123 @@ class EdgeTTSService(BaseTTSService):
         super().__init__(language, speaker, speed, emotion, sample_rate, **kwargs)
         self.voice = voice or speaker
         self._available_voices: Optional[List[Dict[str, str]]] = None
+        self._voice_by_lang: Dict[str, Optional[str]] = {}
+        self._resolved_voice: Optional[Tuple[str, str]] = None  # (language, voice)
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._connector: Optional[_PersistentConnector] = None
+        self._connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # speed/emotion feed the precomputed SSML wrapper, so changing them invalidates it
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        self._speed = value
+        self._ssml_parts = None
+
+    @property
+    def emotion(self) -> Optional[str]:
+        return self._emotion
+
+    @emotion.setter
+    def emotion(self, value: Optional[str]) -> None:
+        self._emotion = value
+        self._ssml_parts = None
+
+    def _get_connector(self) -> _PersistentConnector:
+        """Connector shared by every stream of this service (DNS cache, connection limits)."""
+        loop = asyncio.get_running_loop()
+        if self._connector is None or self._connector.closed or self._connector_loop is not loop:
+            self._connector = _PersistentConnector(limit=32, keepalive_timeout=300, ttl_dns_cache=300)
+            self._connector_loop = loop
+        return self._connector
+
+    async def aclose(self) -> None:
+        """Close the shared connector."""
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.shutdown()
+        self._connector = None
 
     def _ensure_voices_loaded(self) -> None:
-        """Load available voices if not already loaded."""
+        """Load available voices if not already loaded (disk cache first, then network)."""
         if self._available_voices is None:
-            try:
-                import asyncio
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                self._available_voices = loop.run_until_complete(edge_tts.list_voices())
-                loop.close()
-            except Exception:
-                self._available_voices = []
+            voices = self._load_cached_voices()
+            if voices is None:
+                try:
+                    voices = self._fetch_voices()
+                    self._save_cached_voices(voices)
+                except Exception:
+                    voices = []
+            self._set_voices(voices)
+
+    async def _ensure_voices_loaded_async(self) -> None:
+        """Async counterpart of _ensure_voices_loaded; awaits the catalog on the running loop."""
+        if self._available_voices is None:
+            voices = self._load_cached_voices()
+            if voices is None:
+                voices = await self.list_voices()
+                self._save_cached_voices(voices)
+            self._set_voices(voices)
+
+    def _set_voices(self, voices: List[Dict[str, str]]) -> None:
+        self._available_voices = voices
+        self._voice_by_lang = self._build_voice_index(voices)
+
+    @classmethod
+    def _build_voice_index(cls, voices: List[Dict[str, str]]) -> Dict[str, Optional[str]]:
+        """Precompute the preferred voice for every base language code in the catalog."""
+        by_lang: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        for v in voices:
+            by_lang[v.get('Locale', '').split('-')[0]].append(v)
+        return {lang: cls._pick_voice(lang_voices) for lang, lang_voices in by_lang.items()}
+
+    @staticmethod
+    def _pick_voice(lang_voices: List[Dict[str, str]]) -> Optional[str]:
+        """Prefer female voices, then male voices, then whatever comes first."""
+        if not lang_voices:
+            return None
+        for gender in ('Female', 'Male'):
+            for v in lang_voices:
+                if gender in v.get('Gender', ''):
+                    return v['ShortName']
+        return lang_voices[0]['ShortName']
+
+    @classmethod
+    def _load_cached_voices(cls) -> Optional[List[Dict[str, str]]]:
+        """Return the on-disk voice catalog if present and fresher than the TTL."""
+        try:
+            if time.time() - cls.VOICES_CACHE_PATH.stat().st_mtime > cls.VOICES_CACHE_TTL:
+                return None
+            with open(cls.VOICES_CACHE_PATH, 'r', encoding='utf-8') as f:
+                voices = json.load(f)
+            return voices if isinstance(voices, list) and voices else None
+        except Exception:
+            return None
+
+    @classmethod
+    def _save_cached_voices(cls, voices: List[Dict[str, str]]) -> None:
+        if not voices:
+            return
+        try:
+            cls.VOICES_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(cls.VOICES_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(voices, f)
+        except Exception:
+            # Cache is best-effort only
+            pass
+
+    @staticmethod
+    def _fetch_voices() -> List[Dict[str, str]]:
+        """Fetch the voice catalog, safe to call with or without a running event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(edge_tts.list_voices())
+        # Already inside a loop: run the fetch on its own loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(lambda: asyncio.run(edge_tts.list_voices())).result()
 
     def _get_voice_for_language(self, language: str) -> Optional[str]:
         """Get the best voice for the given language."""
@@ -50,56 +193,39 @@ class EdgeTTSService(BaseTTSService):
         if not self._available_voices:
             return None
         
-        # Filter voices by language
+        if language in self._voice_by_lang:
+            return self._voice_by_lang[language]
+        
+        # Not a plain base code (e.g. "en-GB"): fall back to the scan once and memoize
         lang_voices = [v for v in self._available_voices if v.get('Locale', '').startswith(language)]
         if not lang_voices:
             # Fallback to any voice with similar language code
             lang_voices = [v for v in self._available_voices if language in v.get('Locale', '')]
         
-        if not lang_voices:
-            return None
-        
-        # Prefer female voices, then male voices
-        female_voices = [v for v in lang_voices if 'Female' in v.get('Gender', '')]
-        if female_voices:
-            return female_voices[0]['ShortName']
-        
-        male_voices = [v for v in lang_voices if 'Male' in v.get('Gender', '')]
-        if male_voices:
-            return male_voices[0]['ShortName']
-        
-        return lang_voices[0]['ShortName']
+        voice = self._pick_voice(lang_voices)
+        self._voice_by_lang[language] = voice
+        return voice
 
     def _resolve_voice(self) -> str:
         """Resolve the voice to use for synthesis."""
         if self.voice:
             return self.voice
         
-        # Try to find a voice for the current language
-        voice = self._get_voice_for_language(self.language)
-        if voice:
-            return voice
+        # Memoized per language; recomputed only if the language is changed
+        if self._resolved_voice is not None and self._resolved_voice[0] == self.language:
+            return self._resolved_voice[1]
         
-        # Fallback to a default English voice
-        return "en-US-AriaNeural"
+        # Try to find a voice for the current language, else a default English voice
+        voice = self._get_voice_for_language(self.language) or "en-US-AriaNeural"
+        self._resolved_voice = (self.language, voice)
+        return voice
+
+    def _cache_identity(self) -> Tuple:
+        return super()._cache_identity() + (self.voice,)
 
     def _emotion_to_modifiers(self, emotion: Optional[str]) -> Tuple[float, int]:
         """Map emotion to (rate_factor, pitch_percent)."""
-        if not emotion:
-            return (1.0, 0)
-
-        e = emotion.strip().lower()
-        if e in {"happy", "excited", "cheerful"}:
-            return (1.08, +10)
-        if e in {"sad", "melancholic"}:
-            return (0.95, -10)
-        if e in {"angry", "furious"}:
-            return (1.05, +5)
-        if e in {"calm", "serene"}:
-            return (0.98, -5)
-        if e in {"serious", "neutral"}:
-            return (1.0, 0)
-        return (1.0, 0)
+        return _EDGE_EMOTIONS.get((emotion or "").strip().lower(), (1.0, 0))
 
     def _create_ssml(self, text: str, voice_name: str) -> str:
         """Create well-formed SSML with explicit voice and prosody.
@@ -107,70 +233,71 @@ class EdgeTTSService(BaseTTSService):
         - Use percent-based rate/pitch as Azure expects.
         - Escape user text so tags are not spoken.
         """
+        parts = self._ssml_parts
+        if parts is None or parts[0] != voice_name:
+            parts = self._ssml_parts = (voice_name, *self._build_ssml_wrapper(voice_name))
+        return f"{parts[1]}{xml_escape(text)}{parts[2]}"
+
+    def _build_ssml_wrapper(self, voice_name: str) -> Tuple[str, str]:
+        """Return the (prefix, suffix) around the escaped text for this voice/speed/emotion."""
         emo_rate_factor, emo_pitch_percent = self._emotion_to_modifiers(self.emotion)
         combined_rate = max(0.5, min(2.0, float(self.speed) * emo_rate_factor))
         rate_percent = int(round((combined_rate - 1.0) * 100))
         rate_str = ("+" if rate_percent > 0 else "") + f"{rate_percent}%"
         pitch_str = ("+" if emo_pitch_percent > 0 else "") + f"{emo_pitch_percent}%"
 
-        safe_text = xml_escape(text)
         xml_lang = voice_name.split('-')[0] if '-' in voice_name else (self.language or 'en')
 
-        return (
+        prefix = (
             f'<speak version="1.0" xml:lang="{xml_lang}">'
             f'<voice name="{voice_name}">'
-            f'<prosody rate="{rate_str}" pitch="{pitch_str}">{safe_text}</prosody>'
-            f'</voice>'
-            f'</speak>'
+            f'<prosody rate="{rate_str}" pitch="{pitch_str}">'
         )
+        return prefix, '</prosody></voice></speak>'
 
     async def synthesize(self, texts: List[str], output_dir: Path) -> List[Path]:
         """Synthesize multiple texts to audio files."""
         output_dir.mkdir(parents=True, exist_ok=True)
+        if not self.voice:
+            await self._ensure_voices_loaded_async()
         
-        # Clear existing files
-        for file in output_dir.glob("*.wav"):
-            file.unlink()
-        
-        file_paths: List[Path] = []
-        for index, text in enumerate(texts, start=1):
-            out_path = output_dir / f"step_{index}.wav"
-            await self.synthesize_single(text, out_path)
-            file_paths.append(out_path)
-            await asyncio.sleep(0)  # Yield control
+        # Network-bound: stream all utterances concurrently (bounded by the semaphore)
+        file_paths: List[Path] = self._step_paths(output_dir, len(texts))
+        await asyncio.gather(*[
+            self.synthesize_single(text, out_path) for text, out_path in zip(texts, file_paths)
+        ])
         
         return file_paths
 
     async def synthesize_single(self, text: str, output_path: Path) -> Path:
         """Synthesize a single text to an audio file."""
+        if self._cache_fetch(text, output_path):
+            return output_path
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.voice:
+            await self._ensure_voices_loaded_async()
         
         voice = self._resolve_voice()
         ssml_text = self._create_ssml(text, voice)
         
-        # Create temporary file for Edge TTS output
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
+        # Collect the MP3 stream in memory; no temp file round-trip
+        audio = bytearray()
+        async with self._sem:
+            communicate = edge_tts.Communicate(ssml_text, voice, connector=self._get_connector())
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    audio += chunk["data"]
         
-        try:
-            # Generate audio using Edge TTS
-            communicate = edge_tts.Communicate(ssml_text, voice)
-            await communicate.save(str(temp_path))
-            
-            # Convert to WAV with proper sample rate
-            audio = AudioSegment.from_file(str(temp_path), format="mp3")
-            audio = audio.set_frame_rate(self.sample_rate).set_channels(1)
-            audio.export(str(output_path), format="wav")
-            
-        finally:
-            # Clean up temporary file
-            try:
-                temp_path.unlink(missing_ok=True)
-            except Exception:
-                pass
+        # Decode/resample off the event loop so other streams keep flowing
+        await self._run_blocking(self._write_wav, bytes(audio), output_path)
         
+        self._cache_store(text, output_path)
         return output_path
 
+    def _write_wav(self, mp3_bytes: bytes, wav_path: Path) -> None:
+        """Decode MP3 in-process and write mono 16-bit WAV at the target sample rate."""
+        transcode_to_wav(io.BytesIO(mp3_bytes), wav_path, self.sample_rate)
+
     def get_available_speakers(self) -> List[str]:
         """Get list of available voices/speakers."""
         self._ensure_voices_loaded()
@@ -1,109 +1,107 @@
 import asyncio
+import base64
+import io
+import re
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, Optional, Tuple, Union
+import aiohttp
 from gtts import gTTS
-from pydub import AudioSegment
 
 from .base_tts_service import BaseTTSService
+from .tts_utils import transcode_to_wav
+
+# Audio payload in a gTTS batchexecute response line (same pattern gTTS itself uses)
+_GTTS_AUDIO_RE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
 
 class GoogleTTSService(BaseTTSService):
     """Simple TTS using Google gTTS. Outputs WAV PCM with optional min duration."""
 
+    # Maximum number of gTTS requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(self, language: str = "en", tld: str = "com", min_duration: float = 18.0, sample_rate: int = 24000, **kwargs) -> None:
         super().__init__(language=language, sample_rate=sample_rate, **kwargs)
         self.tld = tld
         self.min_duration = min_duration
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
 
     async def synthesize(self, texts: List[str], output_dir: Path) -> List[Path]:
         output_dir.mkdir(parents=True, exist_ok=True)
-        file_paths: List[Path] = []
+        # Network-bound: fetch all steps concurrently over one HTTP session (bounded by the semaphore)
+        file_paths: List[Path] = self._step_paths(output_dir, len(texts))
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*[
+                self.synthesize_single(text, out_path, session=session) for text, out_path in zip(texts, file_paths)
+            ])
+        return file_paths
 
-        for index, text in enumerate(texts, start=1):
-            out_path = output_dir / f"step_{index}.wav"
-            # Generate speech (blocking) in a thread to temporary MP3
-            tmp_mp3 = out_path.with_suffix('.mp3')
-            # Attempt synthesis with a small retry in case of transient network issues
-            attempts_remaining = 2
-            last_error: Exception | None = None
+    async def synthesize_single(self, text: str, output_path: Path, session: Optional[aiohttp.ClientSession] = None) -> Path:
+        """Synthesize a single text to a specific output path"""
+        if self._cache_fetch(text, output_path):
+            return output_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self.synthesize_single(text, output_path, session=own_session)
+        
+        # Fetch MP3 bytes; small retry in case of transient network issues
+        attempts_remaining = 2
+        async with self._sem:
             while attempts_remaining > 0:
                 try:
-                    await asyncio.get_event_loop().run_in_executor(None, self._synthesize_one, text, tmp_mp3)
-                    if tmp_mp3.exists():
+                    mp3_bytes = await self._fetch_mp3(session, text)
+                    if mp3_bytes:
                         break
-                    raise FileNotFoundError(f"Expected temporary MP3 not found: {tmp_mp3}")
+                    raise ValueError("gTTS returned no audio")
                 except Exception as error:
-                    last_error = error
                     attempts_remaining -= 1
                     if attempts_remaining == 0:
                         raise RuntimeError(
-                            f"Failed to synthesize speech to MP3 for step {index}. "
-                            f"Original error: {error}. Ensure internet connectivity and that gTTS is reachable."
+                            f"Failed to synthesize speech to MP3 for {output_path.stem}. Original error: {error}. "
+                            f"Ensure internet connectivity and that gTTS is reachable."
                         ) from error
-            # Post-process to WAV PCM with duration padding
-            self._post_process_to_wav(tmp_mp3, out_path)
-            # Cleanup temp
-            try:
-                tmp_mp3.unlink(missing_ok=True)
-            except Exception:
-                pass
-            file_paths.append(out_path)
-            await asyncio.sleep(0)
-        return file_paths
-
-    async def synthesize_single(self, text: str, output_path: Path) -> Path:
-        """Synthesize a single text to a specific output path"""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Generate speech (blocking) in a thread to temporary MP3
-        tmp_mp3 = output_path.with_suffix('.mp3')
-        attempts_remaining = 2
-        last_error: Exception | None = None
-        while attempts_remaining > 0:
-            try:
-                await asyncio.get_event_loop().run_in_executor(None, self._synthesize_one, text, tmp_mp3)
-                if tmp_mp3.exists():
-                    break
-                raise FileNotFoundError(f"Expected temporary MP3 not found: {tmp_mp3}")
-            except Exception as error:
-                last_error = error
-                attempts_remaining -= 1
-                if attempts_remaining == 0:
-                    raise RuntimeError(
-                        f"Failed to synthesize speech to MP3. Original error: {error}. "
-                        f"Ensure internet connectivity and that gTTS is reachable."
-                    ) from error
         
         # Post-process to WAV PCM with duration padding
-        self._post_process_to_wav(tmp_mp3, output_path)
-        
-        # Cleanup temp
-        try:
-            tmp_mp3.unlink(missing_ok=True)
-        except Exception:
-            pass
+        await self._run_blocking(self._post_process_to_wav, io.BytesIO(mp3_bytes), output_path)
         
+        self._cache_store(text, output_path)
         return output_path
 
-    def _synthesize_one(self, text: str, out_path: Path) -> None:
+    async def _fetch_mp3(self, session: aiohttp.ClientSession, text: str) -> bytes:
+        """Fetch MP3 audio for text, issuing gTTS's per-chunk requests concurrently on the event loop."""
         tts = gTTS(text=text, lang=self.language, tld=self.tld)
-        tts.save(str(out_path))
+        prepare_requests = getattr(tts, "_prepare_requests", None)
+        if prepare_requests is None:
+            # gTTS internals changed: fall back to its blocking client in a thread
+            return await self._run_blocking(self._synthesize_one, tts)
+
+        async def _fetch_part(request) -> bytes:
+            headers = {k: v for k, v in request.headers.items() if k.lower() != "content-length"}
+            async with session.post(request.url, data=request.body, headers=headers) as response:
+                response.raise_for_status()
+                body = await response.text()
+            match = _GTTS_AUDIO_RE.search(body)
+            if not match:
+                raise ValueError("No audio stream in gTTS response")
+            return base64.b64decode(match.group(1).encode("ascii"))
+
+        parts = await asyncio.gather(*[_fetch_part(request) for request in prepare_requests()])
+        return b"".join(parts)
+
+    @staticmethod
+    def _synthesize_one(tts: gTTS) -> bytes:
+        buffer = io.BytesIO()
+        tts.write_to_fp(buffer)
+        return buffer.getvalue()
+
+    def _cache_identity(self) -> Tuple:
+        return super()._cache_identity() + (self.tld, self.min_duration)
 
-    def _post_process_to_wav(self, mp3_path: Path, wav_path: Path) -> None:
-        # Read MP3 explicitly to avoid format detection pitfalls
-        audio = AudioSegment.from_file(str(mp3_path), format="mp3")
-        # mono + sample rate
-        audio = audio.set_channels(1).set_frame_rate(self.sample_rate)
-        # ensure min duration by adding trailing silence
-        duration = len(audio) / 1000.0
-        if duration < self.min_duration:
-            pad_ms = int((self.min_duration - duration) * 1000)
-            audio = audio + AudioSegment.silent(duration=pad_ms)
-        # Export as 16-bit PCM WAV
-        audio.export(
-            str(wav_path),
-            format="wav",
-            parameters=["-acodec", "pcm_s16le", "-ac", "1", "-ar", str(self.sample_rate)]
-        )
+    def _post_process_to_wav(self, mp3_source: Union[str, BinaryIO], wav_path: Path) -> None:
+        # Decode MP3 in-process (no ffmpeg subprocess) and stream mono 16-bit PCM at the
+        # target rate to disk, padded with trailing silence to the min duration
+        transcode_to_wav(mp3_source, wav_path, self.sample_rate, self.min_duration)
 
     def get_available_speakers(self) -> List[str]:
         """Get list of available TLDs/accents for Google TTS."""
@@ -1,6 +1,10 @@
 import asyncio
+import contextlib
+import re
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base_tts_service import BaseTTSService
 from ...utils.tts_config import setup_tts_environment
@@ -8,6 +12,46 @@ from ...utils.tts_config import setup_tts_environment
 # Setup TTS environment to prevent warnings
 setup_tts_environment()
 
+# Speaker name -> id per language, filled from the first model load for that language
+_SPK2ID_CACHE: Dict[str, Dict[str, int]] = {}
+# (autocast dtype, compiled) per language once the shared model has been prepared
+_PREPARED: Dict[str, Tuple[Any, bool]] = {}
+_MODEL_LOCK = threading.RLock()
+# Bounds for one batched model.infer call: rows, and rows x longest sentence (padded phones)
+_MAX_BATCH_ROWS = 16
+_MAX_BATCH_PHONES = 4096
+
+
+@lru_cache(maxsize=4)
+def _get_melo_model(language: str) -> Any:
+    """Load a MeloTTS model once per language per process."""
+    try:
+        from melo.api import TTS as MeloTTS  # type: ignore
+    except Exception as error:
+        raise ModuleNotFoundError(
+            "MeloTTS is not installed. Install via 'pip install git+https://github.com/myshell-ai/MeloTTS.git' "
+            "and ensure dependencies like torch are installed."
+        ) from error
+    return MeloTTS(language=language, device='auto')
+
+
+def _get_spk2id(language: str) -> Dict[str, int]:
+    if language not in _SPK2ID_CACHE:
+        try:
+            # spk2id lives in the bundled config.json; reading it avoids loading weights
+            from melo.download_utils import load_or_download_config
+            _SPK2ID_CACHE[language] = dict(load_or_download_config(language).data.spk2id)
+            return _SPK2ID_CACHE[language]
+        except Exception:
+            pass
+        with _MODEL_LOCK:
+            model = _get_melo_model(language)
+        try:
+            _SPK2ID_CACHE[language] = dict(model.hps.data.spk2id)
+        except Exception:
+            _SPK2ID_CACHE[language] = {}
+    return _SPK2ID_CACHE[language]
+
 
 class MeloTTSService(BaseTTSService):
     """TTS using MeloTTS. Writes WAV directly with configurable speaker and speed."""
@@ -19,6 +63,8 @@ class MeloTTSService(BaseTTSService):
         speed: float = 1.0,
         emotion: Optional[str] = None,
         sample_rate: int = 24000,
+        precision: str = "auto",
+        compile_model: bool = True,
         **kwargs
     ) -> None:
         super().__init__(language, speaker, speed, emotion, sample_rate, **kwargs)
@@ -27,22 +73,105 @@ class MeloTTSService(BaseTTSService):
         # Lazy model init in background thread-safe manner
         self._speaker_name = speaker
         self._speaker_map: Optional[Dict[str, int]] = None
+        # "auto" = fp16 on CUDA, fp32 elsewhere; "fp16"/"bf16"/"fp32" force it (CUDA only)
+        self.precision = (precision or "auto").strip().lower()
+        self._autocast_dtype = None
+        # torch.compile the flow + vocoder on CUDA once the model is loaded (see _compile_model)
+        self.compile_model = bool(compile_model)
+        self._compiled = False
 
     def _ensure_model(self) -> None:
         if self._model is None:
+            # The model is shared per language; the first service to load it decides its
+            # precision/compilation and later services inherit that state
+            with _MODEL_LOCK:
+                self._model = _get_melo_model(self.language)
+                self._speaker_map = _get_spk2id(self.language) or None
+                self._cached_speaker_id = self._resolve_speaker_id()
+                state = _PREPARED.get(self.language)
+                if state is None:
+                    self._apply_precision()
+                    if self.compile_model:
+                        self._compile_model()
+                    if not self._compiled:
+                        # _compile_model already ran a warmup pass when it succeeded
+                        self._warmup()
+                    state = _PREPARED[self.language] = (self._autocast_dtype, self._compiled)
+            self._autocast_dtype, self._compiled = state
+
+    def _apply_precision(self) -> None:
+        """Cast the network to FP16/BF16 and enable TF32 on CUDA; CPU inference stays FP32."""
+        try:
+            import torch  # type: ignore
+            if "cuda" not in str(self._model.device) or self.precision == "fp32":
+                return
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+            torch.backends.cudnn.benchmark = True
+            dtype = torch.bfloat16 if self.precision == "bf16" else torch.float16
+            self._model.model.to(dtype=dtype)
+            self._autocast_dtype = dtype
+        except Exception:
+            # Keep FP32 weights if the cast is not supported
+            self._autocast_dtype = None
+
+    def _compile_model(self) -> None:
+        """Compile the flow and HiFi-GAN decoder once, then warm up so the first real call is fast.
+
+        melo drives the network through SynthesizerTrn.infer(), which torch.compile on the whole
+        module would not capture, so the submodules infer() calls are compiled instead. Output
+        length varies per utterance, hence dynamic shapes rather than CUDA-graph capture.
+        """
+        try:
+            import torch  # type: ignore
+            if "cuda" not in str(self._model.device) or not hasattr(torch, "compile"):
+                return
+            net = self._model.model
+            eager = (net.flow, net.dec)
+            net.flow = torch.compile(net.flow, dynamic=True)
+            net.dec = torch.compile(net.dec, dynamic=True)
             try:
-                from melo.api import TTS as MeloTTS  # type: ignore
-            except Exception as error:
-                raise ModuleNotFoundError(
-                    "MeloTTS is not installed. Install via 'pip install git+https://github.com/myshell-ai/MeloTTS.git' "
-                    "and ensure dependencies like torch are installed."
-                ) from error
-            self._model = MeloTTS(language=self.language, device='auto')
-            # Build speaker name -> id map once
-            try:
-                self._speaker_map = dict(self._model.hps.data.spk2id)
+                with self._inference_context():
+                    self._model.tts_to_file("warmup", self._resolve_speaker_id(), None, quiet=True)
+                self._compiled = True
             except Exception:
-                self._speaker_map = None
+                # Compilation failed on this setup; go back to eager modules
+                net.flow, net.dec = eager
+        except Exception:
+            self._compiled = False
+
+    def _warmup(self) -> None:
+        """Throwaway synthesis so allocator growth and lazy text-frontend loads happen at load time."""
+        try:
+            with self._inference_context():
+                self._model.tts_to_file("hello", self._resolve_speaker_id(), None, speed=1.0, quiet=True)
+        except Exception:
+            # Warmup is best-effort; the first real call just pays the cost instead
+            pass
+
+    def _inference_context(self) -> contextlib.ExitStack:
+        """inference_mode plus CUDA autocast when the model runs in reduced precision."""
+        import torch  # type: ignore
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if self._autocast_dtype is not None:
+            stack.enter_context(torch.autocast("cuda", dtype=self._autocast_dtype))
+        return stack
+
+    @property
+    def _speaker_name(self) -> Optional[str]:
+        return self._speaker_name_value
+
+    @_speaker_name.setter
+    def _speaker_name(self, value: Optional[str]) -> None:
+        self._speaker_name_value = value
+        self._cached_speaker_id: Optional[int] = None
+
+    def _speaker_id(self) -> int:
+        """Resolved speaker id, memoized until the speaker name changes."""
+        if self._cached_speaker_id is None:
+            self._cached_speaker_id = self._resolve_speaker_id()
+        return self._cached_speaker_id
 
     def _resolve_speaker_id(self) -> int:
         # Try to map provided speaker name to id; fallback to first available
@@ -60,38 +189,153 @@ class MeloTTSService(BaseTTSService):
 
     async def synthesize(self, texts: List[str], output_dir: Path) -> List[Path]:
         output_dir.mkdir(parents=True, exist_ok=True)
-        file_paths: List[Path] = []
-        
-        
-        #clear the existing files
-        for file in output_dir.glob("*.wav"):
-            file.unlink()
-
-        for index, text in enumerate(texts, start=1):
-            out_path = output_dir / f"step_{index}.wav"
-            await self.synthesize_single(text, out_path)
-            file_paths.append(out_path)
-            await asyncio.sleep(0)
+        file_paths: List[Path] = self._step_paths(output_dir, len(texts))
+
+        misses = [(text, path) for text, path in zip(texts, file_paths) if not self._cache_fetch(text, path)]
+        if not misses:
+            return file_paths
+        # One worker hop for the whole run; the model sees all steps as a single batch
+        if await self._run_blocking(self._synthesize_batch_blocking, [t for t, _ in misses], [p for _, p in misses]):
+            for text, out_path in misses:
+                self._cache_store(text, out_path)
+        else:
+            # Batching unavailable: fan the steps out over the bounded executor instead
+            await asyncio.gather(*[self.synthesize_single(text, out_path) for text, out_path in misses])
         return file_paths
 
     async def synthesize_single(self, text: str, output_path: Path) -> Path:
+        if self._cache_fetch(text, output_path):
+            return output_path
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        await asyncio.get_event_loop().run_in_executor(None, self._synthesize_blocking, text, output_path)
+        await self._run_blocking(self._synthesize_blocking, text, output_path)
+        self._cache_store(text, output_path)
         return output_path
 
+    def _uses_gpu(self) -> bool:
+        try:
+            import torch  # type: ignore
+            return torch.cuda.is_available()
+        except Exception:
+            return False
+
+    def _synthesize_batch_blocking(self, texts: List[str], output_paths: List[Path]) -> bool:
+        """Synthesize all texts with one batched VITS inference. Returns False if batching failed."""
+        self._ensure_model()
+        try:
+            self._infer_batch(texts, output_paths)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _plan_batches(lengths: List[int]) -> List[List[int]]:
+        """Group sentence indices into batches of similar length within the size caps.
+
+        Sorting by length keeps padding small; a batch closes once another row would exceed
+        _MAX_BATCH_ROWS or _MAX_BATCH_PHONES padded phones. A single sentence longer than the
+        phone cap still gets its own batch.
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+            # Sorted ascending, so this sentence sets the padded length of the batch
+            if current and (len(current) >= _MAX_BATCH_ROWS
+                            or (len(current) + 1) * lengths[index] > _MAX_BATCH_PHONES):
+                batches.append(current)
+                current = []
+            current.append(index)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _infer_batch(self, texts: List[str], output_paths: List[Path]) -> None:
+        """Mirror melo's tts_to_file, but run the sentences of all texts through model.infer in
+        bounded, length-sorted batches."""
+        import numpy as np
+        import soundfile as sf
+        from melo import utils as melo_utils  # type: ignore
+
+        model = self._model
+        language = model.language
+        sampling_rate = model.hps.data.sampling_rate
+
+        # Split every text into sentences, remembering which text each belongs to
+        pieces: List[Any] = []
+        owners: List[int] = []
+        for index, text in enumerate(texts):
+            for sentence in model.split_sentences_into_pieces(text, language, quiet=True):
+                if language in ['EN', 'ZH_MIX_EN']:
+                    sentence = re.sub(r'([a-z])([A-Z])', r'\1 \2', sentence)
+                pieces.append(melo_utils.get_text_for_tts_infer(sentence, language, model.hps, model.device, model.symbol_to_id))
+                owners.append(index)
+
+        lengths = [len(phones) for _, _, phones, _, _ in pieces]
+        segments: List[Any] = [None] * len(pieces)
+        for rows in self._plan_batches(lengths):
+            for row, segment in zip(rows, self._infer_pieces([pieces[row] for row in rows])):
+                segments[row] = segment
+
+        per_text: List[List[np.ndarray]] = [[] for _ in texts]
+        for row, owner in enumerate(owners):
+            per_text[owner].append(segments[row])
+
+        for audio_list, output_path in zip(per_text, output_paths):
+            wav = model.audio_numpy_concat(audio_list, sr=sampling_rate, speed=float(self.speed))
+            sf.write(str(output_path), wav, sampling_rate)
+
+    def _infer_pieces(self, pieces: List[Any]) -> List[Any]:
+        """One padded model.infer call over prepared sentences; returns each one's waveform."""
+        import torch  # type: ignore
+
+        model = self._model
+        speaker_id = self._speaker_id()
+        hop_length = model.hps.data.hop_length
+
+        # Right-pad phones/tones/lang ids and BERT features to the longest sentence
+        lengths = [len(phones) for _, _, phones, _, _ in pieces]
+        batch, max_len = len(pieces), max(lengths)
+        x = torch.zeros(batch, max_len, dtype=torch.long)
+        tones = torch.zeros(batch, max_len, dtype=torch.long)
+        lang_ids = torch.zeros(batch, max_len, dtype=torch.long)
+        bert = torch.zeros(batch, pieces[0][0].shape[0], max_len)
+        ja_bert = torch.zeros(batch, pieces[0][1].shape[0], max_len)
+        for row, (b, jb, phones, tone, lang) in enumerate(pieces):
+            n = lengths[row]
+            x[row, :n], tones[row, :n], lang_ids[row, :n] = phones, tone, lang
+            bert[row, :, :n], ja_bert[row, :, :n] = b, jb
+
+        device = model.device
+        with self._inference_context():
+            audio, _, y_mask, _ = model.model.infer(
+                x.to(device),
+                torch.LongTensor(lengths).to(device),
+                torch.LongTensor([speaker_id] * batch).to(device),
+                tones.to(device),
+                lang_ids.to(device),
+                bert.to(device),
+                ja_bert.to(device),
+                sdp_ratio=0.2,
+                noise_scale=0.6,
+                noise_scale_w=0.8,
+                length_scale=1.0 / float(self.speed),
+            )
+        # Cut each waveform back to its own length using the output frame mask
+        frames = y_mask.sum(dim=(1, 2)).long().tolist()
+        audio = audio[:, 0].float().cpu().numpy()
+        return [audio[row, :frames[row] * hop_length] for row in range(batch)]
+
     def _synthesize_blocking(self, text: str, output_path: Path) -> None:
         self._ensure_model()
-        speaker_id = self._resolve_speaker_id()
+        speaker_id = self._speaker_id()
         # MeloTTS writes WAV directly; speed supported. Emotion currently unused.
-        self._model.tts_to_file(text, speaker_id, str(output_path), speed=float(self.speed))
+        with self._inference_context():
+            self._model.tts_to_file(text, speaker_id, str(output_path), speed=float(self.speed))
 
     @staticmethod
     def list_available_speakers(language: str = "EN") -> List[str]:
         try:
-            from melo.api import TTS as MeloTTS  # type: ignore
-            model = MeloTTS(language=language, device='auto')
-            spk2id = getattr(model.hps.data, 'spk2id', None)
-            if isinstance(spk2id, dict):
+            spk2id = _get_spk2id(language)
+            if spk2id:
                 return list(spk2id.keys())
         except Exception:
             pass
@@ -1,6 +1,116 @@
 import asyncio
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Model-backed services (MeloTTS, Coqui) reused across synthesize_steps calls, keyed by engine
+# and constructor arguments, so switching the engine dropdown back and forth does not rebuild them
+_MODEL_SERVICES: Dict[Tuple, Any] = {}
+
+# Long-lived event loop on a daemon thread that runs every synthesize_steps call
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_THREAD: Optional[threading.Thread] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the background loop used to run TTS coroutines from sync code."""
+    global _LOOP, _LOOP_THREAD
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP_THREAD is None or not _LOOP_THREAD.is_alive():
+            _LOOP = asyncio.new_event_loop()
+            _LOOP_THREAD = threading.Thread(target=_LOOP.run_forever, name="tts-loop", daemon=True)
+            _LOOP_THREAD.start()
+        return _LOOP
+
+
+def transcode_to_wav(source, wav_path, dst_rate: int, min_duration: float = 0.0) -> int:
+    """Decode compressed audio frame by frame straight into a mono 16-bit WAV at dst_rate.
+
+    Each resampled frame is appended to the open file as it is produced, so the full
+    signal is never held in memory. Trailing silence pads the file to min_duration
+    seconds. Returns the number of samples written.
+    """
+    import av
+    import numpy as np
+    import soundfile as sf
+
+    written = 0
+    with av.open(source) as container, sf.SoundFile(str(wav_path), "w", int(dst_rate), 1, "PCM_16") as out:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=int(dst_rate))
+
+        def _write(frames) -> None:
+            nonlocal written
+            for frame in frames:
+                pcm = frame.to_ndarray().reshape(-1)
+                out.write(pcm)
+                written += len(pcm)
+
+        for frame in container.decode(stream):
+            _write(resampler.resample(frame))
+        _write(resampler.resample(None))
+
+        pad = int(min_duration * dst_rate) - written
+        if pad > 0:
+            out.write(np.zeros(pad, dtype=np.int16))
+            written += pad
+    return written
+
+
+@lru_cache(maxsize=None)
+def _pcm16_clamp():
+    """Return a JIT-compiled float -> int16 clamp, or None if Numba is unavailable.
+
+    Compiled (and warmed on a tiny buffer) on first use so importing this module stays cheap.
+    """
+    try:
+        import numpy as np
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def clamp_to_int16(x):
+        out = np.empty(x.shape[0], dtype=np.int16)
+        for i in prange(x.shape[0]):
+            out[i] = np.int16(max(np.float32(-1.0), min(np.float32(1.0), x[i])) * np.float32(32767.0))
+        return out
+
+    clamp_to_int16(np.zeros(16, dtype=np.float32))
+    return clamp_to_int16
+
+
+def float_to_pcm16(x):
+    """Clamp float samples to [-1, 1] and convert to int16 PCM."""
+    import numpy as np
+
+    x = np.ascontiguousarray(x, dtype=np.float32)
+    clamp = _pcm16_clamp()
+    if clamp is not None:
+        return clamp(x)
+    return (np.clip(x, -1.0, 1.0) * 32767.0).astype(np.int16)
+
+
+def resample_to_pcm16(samples, src_rate: int, dst_rate: int):
+    """Downmix (frames, channels) audio to mono and resample to dst_rate in one polyphase pass.
+
+    Accepts int16 or float samples and returns int16 PCM suitable for soundfile.write.
+    """
+    import numpy as np
+    from scipy.signal import resample_poly
+
+    x = np.asarray(samples)
+    if x.dtype == np.int16:
+        x = x.astype(np.float32) / 32768.0
+    else:
+        x = x.astype(np.float32, copy=False)
+    if x.ndim > 1:
+        x = x.mean(axis=1)
+    if src_rate != dst_rate:
+        x = resample_poly(x, int(dst_rate), int(src_rate))
+    return float_to_pcm16(x)
 
 
 def list_speakers(engine: str, language: str) -> List[str]:
@@ -37,29 +147,38 @@ def synthesize_steps(
 ) -> List[Path]:
     engine_lower = (engine or "").strip().lower()
 
+    # Callers glob output_dir for the generated steps, so it must only hold this run
+    from .base_tts_service import BaseTTSService
+    BaseTTSService.clear_outputs(output_dir)
+
     async def _run() -> List[Path]:
         if engine_lower == "melotts":
             from .melotts_service import MeloTTSService
-            tts = MeloTTSService(language=language.upper(), speaker=accent, speed=float(speed), emotion=(emotion or None), sample_rate=int(sample_rate))
-            return await tts.synthesize(texts, output_dir)
-        if engine_lower == "coqui":
+            key = (engine_lower, language.upper(), accent, float(speed), emotion or None, int(sample_rate))
+            tts = _MODEL_SERVICES.get(key)
+            if tts is None:
+                tts = _MODEL_SERVICES[key] = MeloTTSService(language=language.upper(), speaker=accent, speed=float(speed), emotion=(emotion or None), sample_rate=int(sample_rate))
+        elif engine_lower == "coqui":
             from .coqui_tts_service import CoquiTTSService
-            tts = CoquiTTSService(language=language, speaker=accent, speed=float(speed), emotion=(emotion or None), sample_rate=int(sample_rate))
-            return await tts.synthesize(texts, output_dir)
-        if engine_lower == "edgetts":
+            key = (engine_lower, language, accent, float(speed), emotion or None, int(sample_rate))
+            tts = _MODEL_SERVICES.get(key)
+            if tts is None:
+                tts = _MODEL_SERVICES[key] = CoquiTTSService(language=language, speaker=accent, speed=float(speed), emotion=(emotion or None), sample_rate=int(sample_rate))
+        elif engine_lower == "edgetts":
             from .edgetts_service import EdgeTTSService
             tts = EdgeTTSService(language=language, speaker=accent, speed=float(speed), emotion=(emotion or None), sample_rate=int(sample_rate))
+        else:
+            # default to Google
+            from .google_tts_service import GoogleTTSService
+            tts = GoogleTTSService(language=language, tld=(accent or "com"), min_duration=18.0, sample_rate=int(sample_rate))
+        try:
             return await tts.synthesize(texts, output_dir)
-        # default to Google
-        from .google_tts_service import GoogleTTSService
-        tts = GoogleTTSService(language=language, tld=(accent or "com"), min_duration=18.0, sample_rate=int(sample_rate))
-        return await tts.synthesize(texts, output_dir)
+        finally:
+            await tts.aclose()
 
-    try:
-        return asyncio.run(_run())
-    except RuntimeError:
-        # Inside existing loop
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(_run())
+    # Works whether or not the caller already has a running loop, and keeps loop-bound
+    # state (connections, semaphores) valid between calls
+    future = asyncio.run_coroutine_threadsafe(_run(), _get_background_loop())
+    return future.result()
 
 
